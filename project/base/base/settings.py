@@ -56,6 +56,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.contrib.humanize',
+    'django.contrib.postgres',
 ]
 
 MIDDLEWARE = [
@@ -193,9 +194,11 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'PAGE_SIZE': 50,
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'news.pagination.NewsPageNumberPagination',
     'DEFAULT_RENDERER_CLASSES': (
-        'rest_framework.renderers.JSONRenderer',
+        # orjson-backed, byte-compatible with rest_framework.renderers.JSONRenderer
+        'news.renderers.NewsJSONRenderer',
+        'news.renderers.MessagePackRenderer',
         # 'rest_framework.renderers.BrowsableAPIRenderer',
     ),
     'DEFAULT_AUTHENTICATION_CLASSES': [
@@ -223,5 +226,43 @@ CORS_ALLOWED_ORIGINS = [
 # News API configuration
 NEWSAPI_API_KEY = env('NEWSAPI_API_KEY')
 
+# NewsAPI root used by `fetch_provider_articles --async-http`
+NEWSAPI_BASE_URL = env('NEWSAPI_BASE_URL', default='https://newsapi.org/v2')
+NEWS_FETCH_CONCURRENCY = 8              # provider requests in flight at once (and pooled connections)
+NEWS_FETCH_TIMEOUT = 10                 # timeout (seconds) per provider request
+
+# Lifetime (seconds) of cached /api/news/ responses; entries are also retired by ingestion
+NEWS_RESPONSE_CACHE_TIMEOUT = 300
+
+# Front-page snapshots rebuilt after each ingest cycle for every category (and no category),
+# crossed with these languages/countries (and none)
+NEWS_SNAPSHOT_PAGES = 3                 # leading pages materialized per filter combination
+NEWS_SNAPSHOT_LANGUAGES = ['en']
+NEWS_SNAPSHOT_COUNTRIES = ['us']
+NEWS_SNAPSHOT_TIMEOUT = 86400           # lifetime (seconds) when ingestion stops refreshing them
+
+# Opt-in instrumentation of /api/news/: Server-Timing header and slow request log (news.slow_requests)
+NEWS_INSTRUMENTATION = False
+NEWS_SLOW_REQUEST_MS = 500              # requests slower than this are logged with their filter signature
+NEWS_SLOW_QUERY_EXPLAIN_MS = 200        # slow requests whose slowest query exceeds this include its EXPLAIN
+
+# sort_by=relevance pages through at most this many best-scored results
+NEWS_RELEVANCE_TOP_K = 500
+
+# List responses smaller than this (bytes) are sent uncompressed; larger ones are gzip/brotli
+# compressed per Accept-Encoding and cached compressed
+NEWS_COMPRESSION_MIN_SIZE = 1024
+
+# Rows fetched per server-side cursor round trip by the NDJSON export (/api/news/export/)
+NEWS_EXPORT_CHUNK_SIZE = 2000
+
+# Lifetime (seconds) of the seen-URL entries ingestion uses to skip NLP for stored articles
+NEWS_SEEN_URL_TIMEOUT = 604800
+
+# Search term analysis (language detection + phrase derivation) memoization
+SEARCH_ANALYSIS_CACHE_SIZE = 2048       # entries kept in the in-process LRU
+SEARCH_ANALYSIS_CACHE_TIMEOUT = 86400   # lifetime (seconds) in the shared cache
+SEARCH_ANALYSIS_EXECUTOR_WORKERS = 4    # threads running fastText for the async endpoint
+
 # FastText model path
 FASTTEXT_MODEL_PATH = str(os.path.join(BASE_DIR, 'news', 'services', 'language_detect', 'models', 'lid.176.ftz'))
\ No newline at end of file
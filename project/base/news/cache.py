@@ -0,0 +1,133 @@
+import hashlib
+import json
+import logging
+import time
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Global counter bumped whenever ingestion stores new articles.
+# Every cached response key embeds it, so a bump retires all entries without key scans.
+CONTENT_VERSION_KEY = "news:content-version"
+# Unix timestamp of the last bump, exposed as Last-Modified
+CONTENT_UPDATED_AT_KEY = "news:content-updated-at"
+RESPONSE_KEY_PREFIX = "news:list"
+
+
+def _canonical_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple, set)):
+        return sorted(_canonical_value(v) for v in value)
+    return value
+
+
+def canonicalize_filters(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a JSON-friendly, order-independent copy of validated filter data (empty values dropped)."""
+    return {
+        key: _canonical_value(value)
+        for key, value in sorted(filters.items())
+        if value not in (None, "", [], ())
+    }
+
+
+def filter_signature(filters: Dict[str, Any]) -> str:
+    """Stable hash identifying a filter combination."""
+    payload = json.dumps(canonicalize_filters(filters), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def get_content_version() -> int:
+    """
+    Return the current content version.
+    The counter is seeded with the current timestamp so that, if Redis evicts or loses it,
+    the new value is still larger than any version embedded in older cache keys.
+    """
+    try:
+        version = cache.get(CONTENT_VERSION_KEY)
+        if version is None:
+            cache.add(CONTENT_VERSION_KEY, int(time.time()), timeout=None)
+            version = cache.get(CONTENT_VERSION_KEY)
+        return int(version) if version is not None else 0
+    except Exception as e:
+        logger.warning(f"[NEWS] Failed to read content version: {e}")
+        return 0
+
+
+def get_content_state() -> Tuple[int, Optional[int]]:
+    """Return (content version, timestamp of the last bump or None) with a single cache round trip."""
+    try:
+        values = cache.get_many([CONTENT_VERSION_KEY, CONTENT_UPDATED_AT_KEY])
+    except Exception as e:
+        logger.warning(f"[NEWS] Failed to read content state: {e}")
+        return 0, None
+    version = values.get(CONTENT_VERSION_KEY)
+    if version is None:
+        version = get_content_version()
+    return int(version), values.get(CONTENT_UPDATED_AT_KEY)
+
+
+def bump_content_version() -> int:
+    """Increment the content version, retiring every cached news response."""
+    try:
+        try:
+            version = cache.incr(CONTENT_VERSION_KEY)
+        except ValueError:
+            # Key missing: seed it (a concurrent seed wins and is incremented instead)
+            if cache.add(CONTENT_VERSION_KEY, int(time.time()), timeout=None):
+                version = get_content_version()
+            else:
+                version = cache.incr(CONTENT_VERSION_KEY)
+        cache.set(CONTENT_UPDATED_AT_KEY, int(time.time()), timeout=None)
+        return version
+    except Exception as e:
+        logger.warning(f"[NEWS] Failed to bump content version: {e}")
+        return 0
+
+
+def build_response_cache_key(filters: Dict[str, Any], *extra: Optional[str], version: Optional[int] = None) -> str:
+    """Cache key for a list response: content version + filter signature + page/host extras."""
+    if version is None:
+        version = get_content_version()
+    parts = [RESPONSE_KEY_PREFIX, f"v{version}", filter_signature(filters)]
+    parts.extend(str(e) if e is not None else "-" for e in extra)
+    return ":".join(parts)
+
+
+def build_response_keys(filters: Dict[str, Any], *extra: Optional[str]) -> Tuple[str, str, Optional[int]]:
+    """
+    Return (cache key, ETag, Last-Modified timestamp) for a list response.
+    The ETag is derived from the cache key, so it changes exactly when ingestion bumps the
+    content version; validating it costs one cache round trip and no database query.
+    """
+    version, updated_at = get_content_state()
+    key = build_response_cache_key(filters, *extra, version=version)
+    etag = '"%s"' % hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return key, etag, updated_at
+
+
+def get_cached_response(key: str):
+    try:
+        return cache.get(key)
+    except Exception as e:
+        logger.warning(f"[NEWS] Response cache read failed: {e}")
+        return None
+
+
+def set_cached_response(key: str, value: Any) -> None:
+    try:
+        cache.set(key, value, timeout=getattr(settings, "NEWS_RESPONSE_CACHE_TIMEOUT", 300))
+    except Exception as e:
+        logger.warning(f"[NEWS] Response cache write failed: {e}")
+
+
+# Async variants run the blocking cache client in the default executor instead of the
+# single thread used by thread-sensitive sync_to_async.
+abuild_response_keys = sync_to_async(build_response_keys, thread_sensitive=False)
+aget_cached_response = sync_to_async(get_cached_response, thread_sensitive=False)
+aset_cached_response = sync_to_async(set_cached_response, thread_sensitive=False)
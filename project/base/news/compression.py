@@ -0,0 +1,71 @@
+import gzip
+import logging
+from typing import Optional, Tuple
+
+from django.conf import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Compression settings: moderate levels keep compression cheap on cache misses,
+# cache hits reuse the stored bytes
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+DEFAULT_MIN_SIZE = 1024
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """Content codings the server can produce, in order of preference."""
+    if brotli is not None:
+        return ('br', 'gzip')
+    return ('gzip',)
+
+
+def _parse_accept_encoding(header: str) -> dict:
+    accepted = {}
+    for part in header.split(','):
+        coding, _, params = part.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def negotiate_encoding(request) -> Optional[str]:
+    """Return the preferred content coding accepted by `request`, or None for identity."""
+    accepted = _parse_accept_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+    if not accepted:
+        return None
+    for encoding in available_encodings():
+        if accepted.get(encoding, accepted.get('*', 0.0)) > 0:
+            return encoding
+    return None
+
+
+def compress_content(content: bytes, encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    """
+    Compress `content` with `encoding` when it is at least NEWS_COMPRESSION_MIN_SIZE bytes.
+    Returns (bytes, applied encoding or None when sent as-is).
+    """
+    if not encoding or len(content) < getattr(settings, 'NEWS_COMPRESSION_MIN_SIZE', DEFAULT_MIN_SIZE):
+        return content, None
+    if encoding == 'br':
+        return brotli.compress(content, quality=BROTLI_QUALITY), encoding
+    if encoding == 'gzip':
+        # mtime=0 keeps the output deterministic for identical content
+        return gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0), encoding
+    logger.warning(f"[NEWS] Unsupported content coding requested: {encoding}")
+    return content, None
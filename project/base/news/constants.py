@@ -4,3 +4,20 @@ VALID_COUNTRIES = {
 }
 VALID_LANGUAGES = {"ar", "en", "cn", "de", "es", "fr", "he", "it", "nl", "no", "pt", "ru", "sv", "se", "ud", "zh", "en-US"}
 VALID_CATEGORIES = {"business", "entertainment", "general", "health", "science", "sports", "technology"}
+
+# PostgreSQL text search configurations used for each stored article language.
+# Languages without a dedicated configuration fall back to "simple" (no stemming).
+SEARCH_CONFIG_BY_LANGUAGE = {
+    "ar": "arabic",
+    "de": "german",
+    "en": "english",
+    "es": "spanish",
+    "fr": "french",
+    "it": "italian",
+    "nl": "dutch",
+    "no": "norwegian",
+    "pt": "portuguese",
+    "ru": "russian",
+    "sv": "swedish",
+}
+DEFAULT_SEARCH_CONFIG = "simple"
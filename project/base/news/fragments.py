@@ -0,0 +1,130 @@
+import logging
+from typing import List
+
+from .models import Article
+from .renderers import NewsJSONRenderer
+from .serializers import ArticleListSerializer
+
+logger = logging.getLogger(__name__)
+
+# Columns needed to page over stored fragments (sort keys are used by keyset cursors)
+FRAGMENT_FIELDS = ('id', 'list_json', 'published_date', 'title')
+
+_renderer = NewsJSONRenderer()
+
+
+def render_article_fragment(article: Article) -> bytes:
+    """Render the list representation of one article exactly as the list endpoint would."""
+    return _renderer.render_list_data(ArticleListSerializer(article).data)
+
+
+def refresh_list_fragments(queryset, batch_size: int = 500) -> int:
+    """
+    Render and store `Article.list_json` for every article in `queryset`.
+    Returns the number of updated articles.
+    """
+    updated = 0
+    batch = []
+    for article in queryset.for_listing(ArticleListSerializer.Meta.fields).iterator(chunk_size=batch_size):
+        article.list_json = render_article_fragment(article).decode('utf-8')
+        batch.append(article)
+        if len(batch) >= batch_size:
+            Article.objects.bulk_update(batch, ['list_json'])
+            updated += len(batch)
+            batch = []
+    if batch:
+        Article.objects.bulk_update(batch, ['list_json'])
+        updated += len(batch)
+    return updated
+
+
+def fragment_queryset(queryset):
+    """Restrict a list queryset to the stored fragment columns."""
+    return queryset.only(*FRAGMENT_FIELDS)
+
+
+def _missing_fragments_queryset(articles: List[Article]):
+    missing = [a.pk for a in articles if not a.list_json]
+    if not missing:
+        return None
+    logger.debug(f"[NEWS] Rendering {len(missing)} articles without stored fragments")
+    return Article.objects.filter(pk__in=missing).for_listing(ArticleListSerializer.Meta.fields)
+
+
+def _merge_fragments(articles: List[Article], rendered: dict) -> List[bytes]:
+    return [
+        a.list_json.encode('utf-8') if a.list_json else rendered[a.pk]
+        for a in articles
+    ]
+
+
+def collect_fragments(articles: List[Article]) -> List[bytes]:
+    """Return the stored fragments of `articles`, rendering the ones not stored yet."""
+    missing = _missing_fragments_queryset(articles)
+    rendered = {}
+    if missing is not None:
+        rendered = {article.pk: render_article_fragment(article) for article in missing}
+    return _merge_fragments(articles, rendered)
+
+
+async def acollect_fragments(articles: List[Article]) -> List[bytes]:
+    """Async variant of `collect_fragments`."""
+    missing = _missing_fragments_queryset(articles)
+    rendered = {}
+    if missing is not None:
+        rendered = {article.pk: render_article_fragment(article) async for article in missing}
+    return _merge_fragments(articles, rendered)
+
+
+def render_paginated_fragments(paginator, fragments: List[bytes]) -> bytes:
+    """
+    Stitch article fragments into the paginator's envelope.
+    Produces the same bytes as JSONRenderer on `paginator.get_paginated_response(data).data`,
+    as long as `results` is the envelope's last key (true for DRF and keyset pagination).
+    """
+    envelope = paginator.get_paginated_response([]).data
+    envelope.pop('results')
+    return render_envelope(envelope, fragments)
+
+
+def render_envelope(envelope: dict, fragments: List[bytes]) -> bytes:
+    """Render `envelope` (without results) followed by a `results` array made of `fragments`."""
+    head = _renderer.render(envelope)
+    results = b'"results":[' + b','.join(fragments) + b']}'
+    if head == b'{}':
+        return b'{' + results
+    return head[:-1] + b',' + results
+
+
+async def astream_fragment_lines(queryset, chunk_size: int = 2000, fields=None):
+    """
+    Asynchronously yield newline-delimited JSON for `queryset`, one article fragment per line.
+    Rows are read through `aiterator()` (a server-side cursor on PostgreSQL) and emitted per
+    chunk, so memory stays bounded by `chunk_size` rows whatever the size of the export.
+    Under ASGI, Django buffers synchronous streaming iterators entirely before sending them;
+    async iterators are sent chunk by chunk.
+    With `fields` (a sparse fieldset), lines are serialized from the narrowed projection
+    instead of the stored fragments.
+    """
+    if fields:
+        queryset = queryset.for_listing(fields)
+    else:
+        queryset = fragment_queryset(queryset)
+
+    batch = []
+    async for article in queryset.aiterator(chunk_size=chunk_size):
+        batch.append(article)
+        if len(batch) >= chunk_size:
+            yield await _andjson_chunk(batch, fields)
+            batch = []
+    if batch:
+        yield await _andjson_chunk(batch, fields)
+
+
+async def _andjson_chunk(articles: List[Article], fields=None) -> bytes:
+    if fields:
+        # Every requested column is loaded: serializing does not query
+        lines = [_renderer.render_list_data(item) for item in ArticleListSerializer(articles, many=True, fields=fields).data]
+    else:
+        lines = await acollect_fragments(articles)
+    return b'\n'.join(lines) + b'\n'
@@ -0,0 +1,166 @@
+import json
+import logging
+import time
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection
+
+from .cache import canonicalize_filters, filter_signature
+
+logger = logging.getLogger(__name__)
+slow_logger = logging.getLogger('news.slow_requests')
+
+DEFAULT_SLOW_REQUEST_MS = 500
+DEFAULT_SLOW_QUERY_EXPLAIN_MS = 200
+# SQL kept per request for the slow log (the slowest statements are reported)
+MAX_REPORTED_QUERIES = 5
+
+
+class Instrumentation:
+    """
+    Disabled request instrumentation: every hook is a no-op.
+    Views call the hooks unconditionally; RequestInstrumentation records them.
+    """
+    enabled = False
+
+    def measure(self, name: str):
+        return nullcontext()
+
+    def set_filters(self, filters: Dict[str, Any]) -> None:
+        pass
+
+
+# Shared by every view instance while instrumentation is off
+NULL_INSTRUMENTATION = Instrumentation()
+
+
+class RequestInstrumentation(Instrumentation):
+    """
+    Per-request timings: SQL statements (through a connection execute wrapper) and named
+    sections (language detection, serialization, rendering...), reported as a Server-Timing
+    header and, for slow requests, a structured log record keyed by the filter signature.
+    """
+    enabled = True
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.timings: "OrderedDict[str, float]" = OrderedDict()
+        self.queries: List[Tuple[str, Any, bool, float]] = []
+        self.filters: Optional[Dict[str, Any]] = None
+
+    # --- Recording ---
+    @contextmanager
+    def measure(self, name: str):
+        """Add the elapsed time of the block to section `name` (seconds)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - started
+
+    def set_filters(self, filters: Dict[str, Any]) -> None:
+        self.filters = filters
+
+    def __call__(self, execute, sql, params, many, context):
+        """Connection execute wrapper timing every statement."""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, params, many, time.perf_counter() - started))
+
+    @contextmanager
+    def capture_queries(self):
+        with connection.execute_wrapper(self):
+            yield
+
+    # --- Reporting ---
+    @property
+    def db_time(self) -> float:
+        return sum(q[3] for q in self.queries)
+
+    @property
+    def total_time(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self, total: float) -> str:
+        """Server-Timing header value (durations in milliseconds)."""
+        entries = [f'db;dur={self.db_time * 1000:.1f};desc="{len(self.queries)} queries"']
+        entries.extend(f'{name};dur={elapsed * 1000:.1f}' for name, elapsed in self.timings.items())
+        entries.append(f'total;dur={total * 1000:.1f}')
+        return ', '.join(entries)
+
+    def finish(self, request, response) -> None:
+        """Attach Server-Timing to `response` and log the request when it is slow."""
+        total = self.total_time
+        response['Server-Timing'] = self.server_timing(total)
+
+        if total * 1000 < getattr(settings, 'NEWS_SLOW_REQUEST_MS', DEFAULT_SLOW_REQUEST_MS):
+            return
+        record = self.build_record(request, response, total)
+        slow_logger.warning(
+            f"[NEWS] Slow news request {record['signature']} ({record['total_ms']} ms): {json.dumps(record, default=str)}",
+            extra={'news_request': record},
+        )
+
+    def build_record(self, request, response, total: float) -> Dict[str, Any]:
+        filters = self.filters or {}
+        slowest = sorted(self.queries, key=lambda q: q[3], reverse=True)[:MAX_REPORTED_QUERIES]
+        record = {
+            'signature': filter_signature(filters),
+            'filters': canonicalize_filters(filters),
+            'path': request.get_full_path(),
+            'status': response.status_code,
+            'total_ms': round(total * 1000, 1),
+            'db_ms': round(self.db_time * 1000, 1),
+            'query_count': len(self.queries),
+            'sections_ms': {name: round(elapsed * 1000, 1) for name, elapsed in self.timings.items()},
+            'slowest_queries': [{'sql': sql, 'ms': round(elapsed * 1000, 1)} for sql, _, _, elapsed in slowest],
+        }
+
+        # Capture the plan of the slowest statement when it alone crosses the threshold
+        explain_ms = getattr(settings, 'NEWS_SLOW_QUERY_EXPLAIN_MS', DEFAULT_SLOW_QUERY_EXPLAIN_MS)
+        if slowest and slowest[0][3] * 1000 >= explain_ms:
+            sql, params, many, _ = slowest[0]
+            if not many:
+                record['explain'] = explain_query(sql, params)
+        return record
+
+
+def explain_query(sql: str, params) -> Optional[str]:
+    """Return the database plan of a SELECT statement (EXPLAIN, or EXPLAIN QUERY PLAN on SQLite)."""
+    if not sql.lstrip().upper().startswith('SELECT'):
+        return None
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+            return '\n'.join(' '.join(str(col) for col in row) for row in cursor.fetchall())
+    except Exception as e:
+        logger.warning(f"[NEWS] EXPLAIN of slow query failed: {e}")
+        return None
+
+
+def instrumentation_enabled() -> bool:
+    return getattr(settings, 'NEWS_INSTRUMENTATION', False)
+
+
+def instrument_view(method):
+    """
+    Decorator for view handlers: when NEWS_INSTRUMENTATION is on, sets `view.instrumentation`
+    to a RequestInstrumentation for the request, captures its SQL and reports it on the response.
+    """
+    @wraps(method)
+    def wrapper(view, request, *args, **kwargs):
+        if not instrumentation_enabled():
+            return method(view, request, *args, **kwargs)
+
+        instrumentation = view.instrumentation = RequestInstrumentation()
+        with instrumentation.capture_queries():
+            response = method(view, request, *args, **kwargs)
+        instrumentation.finish(request, response)
+        return response
+    return wrapper
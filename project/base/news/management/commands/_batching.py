@@ -0,0 +1,21 @@
+from typing import Iterator, List
+
+
+def iter_id_batches(queryset, batch_size: int, *fields: str) -> Iterator[List]:
+    """
+    Yield the rows of `queryset` in primary-key batches of `batch_size`.
+    Each batch seeks past the last id of the previous one (no OFFSET), so it stays correct when
+    processing a batch removes its rows from `queryset` (e.g. `search_vector__isnull=True`).
+    Rows are ids, or ("id", *fields) tuples when `fields` are given.
+    """
+    last_id = 0
+    while True:
+        queryset_page = queryset.filter(id__gt=last_id).order_by("id")
+        if fields:
+            batch = list(queryset_page.values_list("id", *fields)[:batch_size])
+        else:
+            batch = list(queryset_page.values_list("id", flat=True)[:batch_size])
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1][0] if fields else batch[-1]
@@ -0,0 +1,52 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from news.models import Article
+from news.snapshots import build_snapshots
+
+from ._batching import iter_id_batches
+
+logger = logging.getLogger(__name__)
+
+# Configuration constants
+BATCH_SIZE = 5000             # Number of articles updated per statement
+
+
+class Command(BaseCommand):
+    """
+    Copy Source.country onto Article.country (matched by source name) for existing rows.
+    fetch_provider_articles sets the country for new articles and fetch_provider_sources
+    keeps it in sync when a source's country changes.
+    """
+    help = "Backfill the denormalized Article.country from the Source table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help=f"Number of articles updated per batch (default: {BATCH_SIZE}).",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Re-sync every article instead of only those without a country.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options.get("batch_size") or BATCH_SIZE
+        queryset = Article.objects.all()
+        if not options.get("all"):
+            queryset = queryset.filter(country__isnull=True)
+
+        self.stdout.write("[NEWS] Backfilling article countries...")
+        updated = 0
+        for ids in iter_id_batches(queryset, batch_size):
+            updated += Article.objects.filter(id__in=ids).sync_source_country()
+            self.stdout.write(f"[NEWS] Processed {updated} articles (last id {ids[-1]})")
+
+        if updated:
+            # user_country_code snapshots list the synced rows; rebuilding them bumps the content version
+            build_snapshots()
+        self.stdout.write(f"[NEWS] Country synced for {updated} articles")
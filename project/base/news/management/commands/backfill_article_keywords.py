@@ -0,0 +1,61 @@
+import logging
+
+from django.db import transaction
+from django.core.management.base import BaseCommand
+
+from news.models import Article, ArticleKeyword
+from news.search import sync_article_keywords
+
+from ._batching import iter_id_batches
+
+logger = logging.getLogger(__name__)
+
+# Configuration constants
+BATCH_SIZE = 1000             # Number of articles indexed per transaction
+
+
+class Command(BaseCommand):
+    """
+    Build the normalized ArticleKeyword index from the stored Article.keywords JSON.
+    Processes rows in primary-key batches; by default only articles without index rows are handled.
+    """
+    help = "Populate the ArticleKeyword table from Article.keywords"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help=f"Number of articles indexed per batch (default: {BATCH_SIZE}).",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Rebuild the keyword rows of every article.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options.get("batch_size") or BATCH_SIZE
+        rebuild = options.get("all")
+
+        queryset = Article.objects.all()
+        if not rebuild:
+            queryset = queryset.exclude(
+                id__in=ArticleKeyword.objects.values("article_id")
+            )
+
+        self.stdout.write("[NEWS] Indexing article keywords...")
+        indexed_articles = 0
+        written_rows = 0
+        for batch in iter_id_batches(queryset, batch_size, "keywords"):
+            try:
+                with transaction.atomic():
+                    written_rows += sync_article_keywords(dict(batch), replace=rebuild)
+            except Exception as e:
+                logger.error(f"[NEWS] Keyword indexing failed at ids {batch[0][0]}-{batch[-1][0]}: {e}", exc_info=True)
+                self.stderr.write(f"[NEWS] Keyword indexing failed: {e}")
+                return
+            indexed_articles += len(batch)
+            self.stdout.write(f"[NEWS] Indexed {indexed_articles} articles (last id {batch[-1][0]})")
+
+        self.stdout.write(f"[NEWS] Wrote {written_rows} keyword rows for {indexed_articles} articles")
@@ -0,0 +1,110 @@
+import asyncio
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.test import AsyncClient, override_settings
+from django.urls import reverse
+
+# Configuration constants
+TOTAL_REQUESTS = 200          # Requests sent to each endpoint
+CONCURRENCY = 20              # Requests in flight at the same time
+
+
+class Command(BaseCommand):
+    """
+    Compare concurrent-request throughput of the sync and async news list endpoints.
+    Requests go through Django's ASGI request handling in-process (AsyncClient), so the sync
+    view pays the same sync_to_async hop it pays under uvicorn, against the configured database.
+    Response cache keys include the request URL, so each endpoint is measured on its own entries
+    (filled by its warm-up request); use --no-cache to measure the query path (no response
+    cache, no front-page snapshots).
+    """
+    help = "Benchmark /api/news/ (sync) against /api/news/async/ under concurrent requests"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=TOTAL_REQUESTS,
+            help=f"Number of requests per endpoint (default: {TOTAL_REQUESTS}).",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=CONCURRENCY,
+            help=f"Concurrent in-flight requests (default: {CONCURRENCY}).",
+        )
+        parser.add_argument(
+            "--query",
+            type=str,
+            default="",
+            help='Query string sent with every request, e.g. "category=technology&page=2".',
+        )
+        parser.add_argument(
+            "--host",
+            type=str,
+            default="localhost",
+            help="Host header (must be allowed by ALLOWED_HOSTS).",
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Disable the response cache and snapshot serving so every request runs the query.",
+        )
+
+    def handle(self, *args, **options):
+        endpoints = [
+            ("sync", reverse("news:news-retrieval-with-filters")),
+            ("async", reverse("news:news-retrieval-async")),
+        ]
+        query = options.get("query") or ""
+
+        overrides = {}
+        if options.get("no_cache"):
+            # Front pages would still be answered from snapshots without NEWS_SNAPSHOT_PAGES=0
+            overrides = {"NEWS_RESPONSE_CACHE_TIMEOUT": 0, "NEWS_SNAPSHOT_PAGES": 0}
+        with override_settings(**overrides):
+            for name, path in endpoints:
+                url = f"{path}?{query}" if query else path
+                result = asyncio.run(self.run_benchmark(
+                    url, options["requests"], options["concurrency"], options["host"]
+                ))
+                self.report(name, url, result)
+
+    async def run_benchmark(self, url: str, total: int, concurrency: int, host: str) -> dict:
+        client = AsyncClient(headers={"host": host})
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies = []
+        statuses = {}
+
+        async def one_request():
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(url)
+                latencies.append(time.perf_counter() - started)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        # Warm up model loading, connections and caches outside the measurement
+        await client.get(url)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one_request() for _ in range(total)))
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        return {
+            "elapsed": elapsed,
+            "throughput": total / elapsed if elapsed else 0.0,
+            "p50": statistics.median(latencies) * 1000,
+            "p95": latencies[max(0, int(len(latencies) * 0.95) - 1)] * 1000,
+            "statuses": statuses,
+        }
+
+    def report(self, name: str, url: str, result: dict):
+        statuses = ", ".join(f"{code}: {count}" for code, count in sorted(result["statuses"].items()))
+        self.stdout.write(
+            f"[NEWS][bench] {name:<5} {url} | {result['throughput']:.1f} req/s | "
+            f"p50 {result['p50']:.1f} ms | p95 {result['p95']:.1f} ms | "
+            f"total {result['elapsed']:.2f} s | status {statuses}"
+        )
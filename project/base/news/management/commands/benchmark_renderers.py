@@ -0,0 +1,97 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from news.models import Article
+from news.renderers import MessagePackRenderer, NewsJSONRenderer
+from news.serializers import ArticleListSerializer
+
+# Configuration constants
+PAGE_SIZES = (50, 200, 1000)  # List items per rendered page
+ITERATIONS = 200              # Renders per renderer and page size
+
+
+class Command(BaseCommand):
+    """
+    Compare the stock DRF JSONRenderer with the orjson and MessagePack renderers on
+    list pages of 50/200/1000 items, shaped like /api/news/ responses.
+    Items come from stored articles (repeated when there are fewer rows) or are synthetic.
+    """
+    help = "Benchmark the news API renderers on list pages"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=ITERATIONS,
+            help=f"Renders per renderer and page size (default: {ITERATIONS}).",
+        )
+        parser.add_argument(
+            "--synthetic",
+            action="store_true",
+            help="Use synthetic items instead of stored articles.",
+        )
+
+    def handle(self, *args, **options):
+        iterations = options.get("iterations") or ITERATIONS
+        items = self.load_items(max(PAGE_SIZES), options.get("synthetic"))
+        renderers = [
+            ("drf-json", JSONRenderer()),
+            ("orjson", NewsJSONRenderer()),
+            ("msgpack", MessagePackRenderer()),
+        ]
+
+        for size in PAGE_SIZES:
+            page = self.build_page(items, size)
+            reference = JSONRenderer().render(page)
+            for name, renderer in renderers:
+                content = renderer.render(page)
+                started = time.perf_counter()
+                for _ in range(iterations):
+                    renderer.render(page)
+                elapsed = time.perf_counter() - started
+
+                same = ""
+                if isinstance(renderer, JSONRenderer):
+                    same = " | identical to drf-json" if content == reference else " | DIFFERS from drf-json"
+                self.stdout.write(
+                    f"[NEWS][bench] {size:>4} items | {name:<8} | "
+                    f"{elapsed / iterations * 1000:.3f} ms/render | {len(content)} bytes{same}"
+                )
+
+    def load_items(self, count: int, synthetic: bool) -> list:
+        """Return `count` serialized list items."""
+        rows = []
+        if not synthetic:
+            queryset = Article.objects.for_listing(ArticleListSerializer.Meta.fields)[:count]
+            rows = list(ArticleListSerializer(queryset, many=True).data)
+        if not rows:
+            self.stdout.write("[NEWS] Using synthetic list items")
+            now = timezone.now()
+            rows = list(ArticleListSerializer([
+                Article(
+                    id=i,
+                    title=f"Sample headline number {i} about markets, climate and sport — «quoted»",
+                    content="Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 8,
+                    url=f"https://example.com/news/{i}",
+                    category="general",
+                    source="Example News",
+                    author="Jane Doe",
+                    url_to_image=f"https://example.com/images/{i}.jpg",
+                    published_date=now - timedelta(minutes=i),
+                )
+                for i in range(1, count + 1)
+            ], many=True).data)
+        return (rows * (count // len(rows) + 1))[:count]
+
+    def build_page(self, items: list, size: int) -> dict:
+        """Paginated envelope with `size` results, as returned by the list endpoint."""
+        return {
+            "count": size * 10,
+            "next": "https://example.com/api/news/?page=2",
+            "previous": None,
+            "results": items[:size],
+        }
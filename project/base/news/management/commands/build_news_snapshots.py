@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from news.snapshots import build_snapshots
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the front-page snapshots served by the news list endpoints.
+    fetch_provider_articles refreshes them after every cycle that stores articles;
+    run this after deploying or changing NEWS_SNAPSHOT_* settings.
+    """
+    help = "Materialize the first pages of hot (category, language, country) news lists"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--category",
+            type=str,
+            default=None,
+            help="Only rebuild the snapshots of this category (and the unfiltered list).",
+        )
+
+    def handle(self, *args, **options):
+        categories = None
+        if options.get("category"):
+            categories = [None, options["category"]]
+
+        self.stdout.write("[NEWS] Building front-page snapshots...")
+        stored = build_snapshots(categories)
+        self.stdout.write(f"[NEWS] Stored {stored} front-page snapshots")
@@ -3,20 +3,29 @@ import logging
 import threading
 import signal
 import re
+import httpx
 import requests
 
-from typing import Any, Dict, Iterable, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from itertools import product
+from typing import Dict, List, Optional
 from datetime import datetime
 
 from django.db import transaction
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
-from news.models import Article
+from news.constants import VALID_COUNTRIES
+from news.fragments import refresh_list_fragments
+from news.models import Article, Source
+from news.providers.newsapiorg.async_client import ThreadedNewsApiOrgProvider
 from news.providers.newsapiorg.client import NewsApiOrgProvider
-from news.providers.newsapiorg.helpers import normalize_articles
+from news.providers.newsapiorg.helpers import canonical_code, normalize_articles
+from news.search import refresh_search_vectors, sync_article_keywords
+from news.seen_urls import article_content_hash, classify_articles, mark_urls_seen
+from news.snapshots import build_snapshots
 
-from news.services.language_detect.detect import detect_language
+from news.services.article_nlp.pool import ArticleAnalysis, ArticleNLPPool, analyze_article_texts
 from news.services.keyword_extraction.extractor import KeywordExtractorService
 
 logger = logging.getLogger(__name__)
@@ -25,6 +34,19 @@ logger = logging.getLogger(__name__)
 TASK_SLEEP_INTERVAL = 5       # Time to wait between batches (seconds)
 MAX_RETRIES = 3               # Maximum retries before restarting
 BATCH_SIZE = 50               # Number of articles per fetch
+FETCH_WORKERS = 4             # Fetch threads draining the category x country task queue
+DEFAULT_COUNTRY = "us"        # Country fetched when --country is omitted
+NLP_BATCH_SIZE = 10           # Article texts analyzed together (one fastText call, one NLP worker task)
+# Columns rewritten when a fetched article's content hash changed
+UPSERT_FIELDS = [
+    'title', 'content', 'description', 'author', 'url_to_image', 'published_date',
+    'keywords', 'language', 'content_hash',
+]
+
+
+def parse_code_list(value: str) -> List[str]:
+    """Split a comma-separated option into canonical lowercase codes (duplicates dropped)."""
+    return list(dict.fromkeys(code for code in (canonical_code(c) for c in value.split(',')) if code))
 
 
 class Command(BaseCommand):
@@ -32,15 +54,18 @@ class Command(BaseCommand):
     Fetch articles from news provider APIs in a background loop.
     Supports:
     - Graceful shutdown on system signals (SIGTERM, SIGINT, SIGHUP)
-    - Multi-threaded fetching for each category if no category is specified
+    - Category x country task grid (every category if none is specified) drained by a fixed-size thread pool
     - Retry logic on transient errors with a maximum retry limit
-    - Keyword extraction and language detection for each article
+    - Keyword extraction and language detection for each article, optionally in a process pool
+    - Content-hash change detection: new articles are inserted, changed ones rewritten, unchanged ones skipped
     """
     help = "Fetch articles from provider APIs with proper resource management"
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.shutdown_requested = threading.Event()
+        self.nlp_pool = None
+        self.nlp_batch_size = NLP_BATCH_SIZE
 
     # --- Signal Handling ---
     def signal_handler(self, signum, frame):
@@ -73,7 +98,7 @@ class Command(BaseCommand):
             "--category",
             type=str,
             default=None,
-            help="Optional category to fetch.",
+            help="Optional category (or comma-separated categories) to fetch.",
         )
         parser.add_argument(
             "--page-size",
@@ -84,14 +109,37 @@ class Command(BaseCommand):
         parser.add_argument(
             "--country",
             type=str,
-            default=None,
-            help="Country code for provider requests.",
+            default=DEFAULT_COUNTRY,
+            help=f"Comma-separated country codes for provider requests, or 'all' (default: {DEFAULT_COUNTRY}).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=FETCH_WORKERS,
+            help=f"Fetch threads draining the category x country task queue (default: {FETCH_WORKERS}).",
         )
         parser.add_argument(
             "--once",
             action="store_true",
             help="Run a single fetch cycle and exit.",
         )
+        parser.add_argument(
+            "--async-http",
+            action="store_true",
+            help="Use the pooled asyncio HTTP client (shared keep-alive connections, NEWS_FETCH_CONCURRENCY cap).",
+        )
+        parser.add_argument(
+            "--nlp-workers",
+            type=int,
+            default=0,
+            help="Worker processes for keyword extraction/language detection (default: 0, run in the fetch threads).",
+        )
+        parser.add_argument(
+            "--nlp-batch-size",
+            type=int,
+            default=NLP_BATCH_SIZE,
+            help=f"Article texts analyzed per batch / NLP worker task (default: {NLP_BATCH_SIZE}).",
+        )
 
     def handle(self, *args, **options):
         self.setup_signal_handlers()
@@ -101,123 +149,200 @@ class Command(BaseCommand):
         if not api_key:
             self.stderr.write("[NEWS] Missing NEWSAPI_API_KEY in settings/environment.")
             return
+
+        countries = parse_code_list(options.get('country') or DEFAULT_COUNTRY)
+        if countries == ['all']:
+            countries = sorted(VALID_COUNTRIES)
+        invalid_countries = [c for c in countries if c not in VALID_COUNTRIES]
+        if invalid_countries:
+            self.stderr.write(f"[NEWS] Unsupported country codes: {', '.join(invalid_countries)}")
+            return
+        options['countries'] = countries
         
-        provider = NewsApiOrgProvider(api_key=api_key)
+        provider = self.build_provider(api_key, options)
         keyword_extractor = KeywordExtractorService()
 
-        # Check if category is specified
-        if not options.get('category'):
-            self.stdout.write("[NEWS] No category specified, fetching all supported categories...")
-            try:
-                supported_categories = provider.categories
-                self.stdout.write(f"[NEWS] Found {len(supported_categories)} categories: {', '.join(supported_categories)}")
-                
-                # Create threads for each category
-                threads = []
-                for category in supported_categories:
-                    category_options = options.copy()
-                    category_options['category'] = category
-                    thread = threading.Thread(
-                        target=self.run_category_fetch,
-                        args=(provider, keyword_extractor, category_options, category),
-                        name=f"fetch-{category}"
-                    )
-                    thread.daemon = True
-                    thread.start()
-                    threads.append(thread)
-                    self.stdout.write(f"[NEWS] Started thread for category: {category}")
-                
-                # Wait for all threads or shutdown signal
-                while not self.shutdown_requested.is_set():
-                    # Check if any threads are still alive
-                    alive_threads = [t for t in threads if t.is_alive()]
-                    if not alive_threads:
-                        self.stdout.write("[NEWS] All category threads completed")
-                        break
-                    self.interruptible_sleep(1)
-                
-                # Wait for threads to finish gracefully
-                for thread in threads:
-                    thread.join(timeout=5)
-                    
-            except AttributeError:
-                self.stderr.write("[NEWS] Provider does not support categories attribute")
-                return
-        else:
-            # Single category mode (original behavior)
-            if options.get('once'):
-                self.run_with_retries(provider, keyword_extractor, options)
-            else:
-                while not self.shutdown_requested.is_set():
-                    success = self.run_with_retries(provider, keyword_extractor, options)
-                    if not success and not self.shutdown_requested.is_set():
-                        self.stdout.write(f"[NEWS] Failed after {MAX_RETRIES} attempts. Restarting...")
-                        if self.interruptible_sleep(TASK_SLEEP_INTERVAL):
-                            break
-                    # Wait for the configured interval before next cycle
-                    if self.interruptible_sleep(options.get('interval', 300)):
-                        break
+        # YAKE is pure Python: a process pool lets the fetch threads use more than one core
+        self.nlp_batch_size = max(1, options.get('nlp_batch_size') or NLP_BATCH_SIZE)
+        if options.get('nlp_workers'):
+            self.nlp_pool = ArticleNLPPool(
+                options['nlp_workers'], batch_size=self.nlp_batch_size, model_path=settings.FASTTEXT_MODEL_PATH,
+            )
+            self.stdout.write(f"[NEWS] Started NLP process pool with {options['nlp_workers']} workers")
+        try:
+            self.run_fetch(provider, keyword_extractor, options)
+        finally:
+            if self.nlp_pool is not None:
+                self.nlp_pool.shutdown()
+            if isinstance(provider, ThreadedNewsApiOrgProvider):
+                provider.close()
 
         self.stdout.write("[NEWS] Fetch task stopped gracefully")
 
-    def run_category_fetch(self, provider: NewsApiOrgProvider, keyword_extractor: KeywordExtractorService, options: dict, category: str):
-        """Run fetch loop for a specific category in a separate thread."""
-        self.stdout.write(f"[NEWS][{category}] Starting fetch loop...")
-        
-        if options.get('once'):
-            self.run_with_retries(provider, keyword_extractor, options)
-        else:
+    def build_provider(self, api_key: str, options: dict):
+        """Provider client: newsapi-python by default, the pooled asyncio client with --async-http."""
+        if not options.get('async_http'):
+            return NewsApiOrgProvider(api_key=api_key)
+
+        concurrency = getattr(settings, 'NEWS_FETCH_CONCURRENCY', 8)
+        self.stdout.write(f"[NEWS] Using the asyncio HTTP client (concurrency {concurrency})")
+        return ThreadedNewsApiOrgProvider(
+            api_key=api_key,
+            base_url=getattr(settings, 'NEWSAPI_BASE_URL', 'https://newsapi.org/v2'),
+            concurrency=concurrency,
+            timeout=getattr(settings, 'NEWS_FETCH_TIMEOUT', 10),
+        )
+
+    def run_fetch(self, provider: NewsApiOrgProvider, keyword_extractor: KeywordExtractorService, options: dict):
+        """
+        Run fetch rounds over the category x country task grid.
+        Each round queues every task on a fixed-size thread pool, waits for it to drain, then sleeps --interval.
+        """
+        try:
+            categories = self.resolve_categories(provider, options)
+        except AttributeError:
+            self.stderr.write("[NEWS] Provider does not support categories attribute")
+            return
+
+        countries = options['countries']
+        tasks = list(product(categories, countries))
+        if not tasks:
+            self.stderr.write("[NEWS] No category/country pairs to fetch")
+            return
+        workers = min(max(1, options.get('workers') or FETCH_WORKERS), len(tasks))
+        self.stdout.write(
+            f"[NEWS] {len(tasks)} fetch tasks ({len(categories)} categories x {len(countries)} countries) "
+            f"on {workers} workers"
+        )
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch")
+        try:
             while not self.shutdown_requested.is_set():
-                success = self.run_with_retries(provider, keyword_extractor, options)
-                if not success and not self.shutdown_requested.is_set():
-                    self.stdout.write(f"[NEWS][{category}] Failed after {MAX_RETRIES} attempts. Restarting...")
-                    if self.interruptible_sleep(TASK_SLEEP_INTERVAL):
-                        break
-                
-                # Wait for the configured interval before next cycle
+                self.run_fetch_round(executor, provider, keyword_extractor, options, tasks)
+                if options.get('once'):
+                    break
+                # Wait for the configured interval before next round
+                self.stdout.write("[NEWS] Waiting before next cycle...")
                 if self.interruptible_sleep(options.get('interval', 300)):
                     break
-        
-        self.stdout.write(f"[NEWS][{category}] Thread stopped")
+        finally:
+            # Queued tasks are dropped; running ones stop at their next shutdown check
+            executor.shutdown(wait=True, cancel_futures=True)
 
-    def run_with_retries(self, provider: NewsApiOrgProvider, keyword_extractor: KeywordExtractorService, options: dict) -> bool:
-        """Try to fetch and process articles with retries."""
+    def run_fetch_round(self, executor: ThreadPoolExecutor, provider: NewsApiOrgProvider, keyword_extractor: KeywordExtractorService, options: dict, tasks) -> None:
+        """
+        Queue every (category, country) task and wait for the round (or a shutdown), then refresh
+        the snapshots of the categories written by the finished tasks.
+        """
+        prefetched = self.prefetch_headlines(provider, options, tasks)
+        futures = {
+            executor.submit(
+                self.run_fetch_task, provider, keyword_extractor, options, category, country,
+                prefetched.get((category, country, 1)),
+            ): category
+            for category, country in tasks
+        }
+        pending = set(futures)
+        while pending and not self.shutdown_requested.is_set():
+            _, pending = wait(pending, timeout=1)
+
+        written_categories = {
+            canonical_code(category) for future, category in futures.items()
+            if future.done() and not future.cancelled() and future.exception() is None and future.result()
+        }
+        self.refresh_snapshots(written_categories)
+
+    def refresh_snapshots(self, categories) -> None:
+        """
+        Rebuild the front-page snapshots of `categories` and of the unfiltered list once per round,
+        after the tasks joined. The rebuild bumps the content version (once), retiring cached responses and ETags.
+        """
+        if not categories:
+            return
+        snapshots = build_snapshots([None, *sorted(categories)])
+        self.stdout.write(f"[NEWS] Rebuilt {snapshots} front-page snapshots for {len(categories)} written categories")
+
+    def prefetch_headlines(self, provider, options: dict, tasks) -> dict:
+        """
+        With --async-http, fetch the first page of every task concurrently before the round
+        (category x country fan-out on the pooled client). Returns {(category, country, 1): articles
+        or exception}; empty for the blocking provider, whose tasks fetch on their own.
+        """
+        if not isinstance(provider, ThreadedNewsApiOrgProvider) or self.shutdown_requested.is_set():
+            return {}
+        return provider.fetch_top_headlines(
+            [(category, country, 1) for category, country in tasks],
+            page_size=options.get('page_size', BATCH_SIZE),
+        )
+
+    def run_fetch_task(self, provider: NewsApiOrgProvider, keyword_extractor: KeywordExtractorService, options: dict, category: str, country: str, prefetched=None) -> int:
+        """
+        Fetch one category/country pair (run by a pool worker). Returns the number of written articles.
+        `prefetched` holds the fan-out result for the pair (articles or the request exception); it
+        replaces the first fetch only, retries request again.
+        """
+        if self.shutdown_requested.is_set():
+            return 0
+
+        task_options = {**options, 'category': category, 'country': country}
+        if prefetched is not None:
+            task_options['prefetched_articles'] = prefetched
+        written = self.run_with_retries(provider, keyword_extractor, task_options)
+        if written is None and not self.shutdown_requested.is_set():
+            self.stdout.write(f"[NEWS][{category}/{country}] Failed after {MAX_RETRIES} attempts, retrying next round")
+        return written or 0
+
+    def resolve_categories(self, provider: NewsApiOrgProvider, options: dict) -> List[str]:
+        """Categories from --category, or every category the provider supports."""
+        if options.get('category'):
+            return parse_code_list(options['category'])
+
+        self.stdout.write("[NEWS] No category specified, fetching all supported categories...")
+        supported_categories = list(provider.categories)
+        self.stdout.write(f"[NEWS] Found {len(supported_categories)} categories: {', '.join(supported_categories)}")
+        return supported_categories
+
+    def run_with_retries(self, provider: NewsApiOrgProvider, keyword_extractor: KeywordExtractorService, options: dict) -> Optional[int]:
+        """
+        Try to fetch and process articles with retries. Returns the number of written articles, None on failure.
+        Only retries wait TASK_SLEEP_INTERVAL: the task holds one of the --workers pool threads meanwhile.
+        """
         for attempt in range(MAX_RETRIES):
             if self.shutdown_requested.is_set():
-                return False
-
-            self.stdout.write(f"[NEWS] Fetch attempt {attempt + 1}/{MAX_RETRIES}")
-            if self.interruptible_sleep(TASK_SLEEP_INTERVAL):
-                return False
+                return None
 
+            self.stdout.write(f"[NEWS][{options.get('category')}/{options.get('country')}] Fetch attempt {attempt + 1}/{MAX_RETRIES}")
             try:
-                self.process_fetch_cycle(provider, keyword_extractor, options)
-                return True
+                return self.process_fetch_cycle(provider, keyword_extractor, options)
             except Exception as e:
                 logger.error(f"[NEWS] Critical error: {e}", exc_info=True)
                 self.stderr.write(f"[NEWS] Fetch failed: {e}")
                 if attempt < MAX_RETRIES - 1:
                     if self.interruptible_sleep(TASK_SLEEP_INTERVAL):
-                        return False
-        return False
+                        return None
+        return None
 
-    def process_fetch_cycle(self, provider: NewsApiOrgProvider, keyword_extractor: KeywordExtractorService, options: dict):
-        """Single fetch cycle: retrieve and store articles."""
+    def process_fetch_cycle(self, provider: NewsApiOrgProvider, keyword_extractor: KeywordExtractorService, options: dict) -> int:
+        """Single fetch cycle: retrieve and store articles. Returns the number of created and updated articles."""
         try:
-            articles = provider.get_top_headlines(
-                country=options.get('country') or "us",
-                category=options.get('category'),
-                page_size=options.get('page_size', BATCH_SIZE),
-            )
-        except requests.exceptions.ConnectionError as e:
+            articles = options.pop('prefetched_articles', None)
+            if isinstance(articles, Exception):
+                raise articles
+            if articles is None:
+                articles = provider.get_top_headlines(
+                    country=options.get('country') or DEFAULT_COUNTRY,
+                    category=options.get('category'),
+                    page_size=options.get('page_size', BATCH_SIZE),
+                )
+        except (requests.exceptions.ConnectionError, httpx.ConnectError) as e:
             logger.error(f"[NEWS] Network connection error: {e}")
             self.stderr.write("[NEWS] Failed to connect to news API. Check your internet connection.")
             raise
-        except requests.exceptions.Timeout as e:
+        except (requests.exceptions.Timeout, httpx.TimeoutException) as e:
             logger.error(f"[NEWS] Request timeout: {e}")
             self.stderr.write("[NEWS] Request to news API timed out.")
             raise
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, httpx.HTTPError) as e:
             logger.error(f"[NEWS] Request error: {e}")
             self.stderr.write(f"[NEWS] API request failed: {e}")
             raise
@@ -225,95 +350,120 @@ class Command(BaseCommand):
         self.stdout.write(f"[NEWS] API returned {len(articles)} articles at {datetime.now()}")
         
         if not articles:
-            self.stdout.write("[NEWS] No articles retrieved, sleeping...")
-            self.interruptible_sleep(options.get('interval', TASK_SLEEP_INTERVAL))
-            return
-
-        prepared_articles = []
-        for article in normalize_articles(articles):
-            if self.shutdown_requested.is_set():
-                break
+            self.stdout.write("[NEWS] No articles retrieved")
+            return 0
+
+        # Skip articles stored unchanged by earlier cycles (or other threads) before running NLP on them
+        normalized_articles = {a["url"]: a for a in normalize_articles(articles) if a.get("url")}
+        for article in normalized_articles.values():
+            article["content_hash"] = article_content_hash(article)
+        changes = classify_articles({url: a["content_hash"] for url, a in normalized_articles.items()})
+        changed_urls = set(changes.changed)
+        normalized_articles = [normalized_articles[url] for url in changes.new + changes.changed]
+        self.stdout.write(
+            f"[NEWS] {len(changes.new)} new, {len(changes.changed)} changed, "
+            f"{len(changes.unchanged)} unchanged articles"
+        )
 
+        texts = []
+        for article in normalized_articles:
             # Ensure content fields are not None
             title = article.get('title') or ''
             description = article.get('description') or ''
             content = article.get('content') or ''
             
             # combining title, description, content for better keyword extraction
-            article_full_content = f"{title} {description} {content}"
-            
-            # keyword extraction and language detection.
-            # fall back to 'en' if detection fails and empty keywords
-            keywords, language = self._prepare_article_keywords_and_language(
-                article_full_content, keyword_extractor
-            )
+            texts.append(f"{title} {description} {content}")
+
+        # keyword extraction and language detection (in the NLP process pool when configured).
+        # fall back to 'en' if detection fails and empty keywords
+        analyses = self._analyze_article_texts(texts, keyword_extractor)
+
+        prepared_articles = []
+        for article, (keywords, language) in zip(normalized_articles, analyses):
             if not keywords and not language:
                 logger.warning(f"[NEWS] Skipping article due to failed keyword/language extraction: {article.get('url')}")
                 continue
 
             article['keywords'] = keywords
-            article['language'] = language
-            article['category'] = options.get('category')
+            # Category and language are stored in canonical lowercase (exact, indexed filtering)
+            article['language'] = canonical_code(language)
+            article['category'] = canonical_code(options.get('category'))
             prepared_articles.append(article)
 
-        stored_count = 0
+        created_count = updated_count = 0
         if prepared_articles:
             # TEMPORARY: Clear existing articles for testing
             # with transaction.atomic():
             #     Article.objects.all().delete()
 
-            # Prepare unique URLs to avoid duplicates in the same batch
-            unique_articles = {a["url"]: a for a in prepared_articles}.values()
-            urls = [a["url"] for a in unique_articles]
-
-            # Fetch existing articles to avoid duplicates
-            existing_urls = set(
-                Article.objects.filter(url__in=urls).values_list("url", flat=True)
-            )
+            # Denormalize the source country so country filtering is a single indexed lookup
+            source_countries = self._resolve_source_countries({a["source"] for a in prepared_articles})
+            for article in prepared_articles:
+                article["country"] = source_countries.get(article["source"])
 
-            # Filter only new articles
-            new_articles = [a for a in unique_articles if a["url"] not in existing_urls]
-
-            # Bulk create new articles
-            article_objs = [Article(**a) for a in new_articles]
+            # Insert new articles and rewrite changed ones (category and country keep their first values)
+            article_objs = [Article(**a) for a in prepared_articles]
             try:
                 with transaction.atomic():
-                    Article.objects.bulk_create(article_objs, ignore_conflicts=True)
-                stored_count = len(article_objs)
+                    Article.objects.bulk_create(
+                        article_objs,
+                        update_conflicts=True,
+                        unique_fields=['url'],
+                        update_fields=UPSERT_FIELDS,
+                    )
+                    stored_urls = [a["url"] for a in prepared_articles]
+                    # Build the full-text search documents of the written rows
+                    refresh_search_vectors(Article.objects.filter(url__in=stored_urls))
+                    # Index the extracted keywords of the written rows (replacing those of changed rows)
+                    keywords_by_url = {a["url"]: a["keywords"] for a in prepared_articles}
+                    sync_article_keywords({
+                        article_id: keywords_by_url[url]
+                        for article_id, url in Article.objects.filter(url__in=stored_urls).values_list("id", "url")
+                    }, replace=bool(changed_urls))
+                    # Render the list representation once, served as-is by the list endpoint
+                    refresh_list_fragments(Article.objects.filter(url__in=stored_urls))
+                    # Later cycles skip these URLs until their content changes again
+                    content_hashes = {a["url"]: a["content_hash"] for a in prepared_articles}
+                    transaction.on_commit(lambda: mark_urls_seen(content_hashes))
+                updated_count = sum(1 for a in prepared_articles if a["url"] in changed_urls)
+                created_count = len(prepared_articles) - updated_count
             except Exception as e:
-                logger.error(f"[NEWS] Bulk create failed: {e}")
+                logger.error(f"[NEWS] Bulk upsert failed: {e}")
 
-        self.stdout.write(f"[NEWS] Stored {stored_count} new articles")
-        self.stdout.write("[NEWS] Waiting before next cycle...")
-        self.interruptible_sleep(options.get('interval', TASK_SLEEP_INTERVAL))
-
-    def _prepare_article_keywords_and_language(self, text: str, keyword_extractor: KeywordExtractorService) -> Iterable[Dict[str, Any]]:
+        self.stdout.write(
+            f"[NEWS] Stored articles: {created_count} created, {updated_count} updated, "
+            f"{len(changes.unchanged)} unchanged"
+        )
+        # Snapshots of the written categories are rebuilt once the whole round joined (run_fetch_round)
+        return created_count + updated_count
+
+    def _resolve_source_countries(self, source_names) -> Dict[str, str]:
+        """Map source names to their lowercased country from the Source table."""
+        if not source_names:
+            return {}
+        return {
+            name: country.lower()
+            for name, country in Source.objects.filter(name__in=source_names).values_list("name", "country")
+            if country
+        }
+
+    def _analyze_article_texts(self, texts: List[str], keyword_extractor: KeywordExtractorService) -> List[ArticleAnalysis]:
         """
-        Normalize raw article data from NewsAPI to a standard format.
-        Includes keyword extraction and language detection.
+        Keyword extraction and language detection for each article text.
+        Runs in the NLP process pool when --nlp-workers is set, otherwise in the calling thread
+        (stopping early when shutdown is requested).
         """
-        # Extract keywords
-        keywords = []
-        try:
-            # using the keyword extractor service (Yake)
-            keywords = keyword_extractor.extract_keywords(text)
-            if not keywords:
-                return [], 'en'
-        except Exception as e:
-            logger.warning(f"[NEWS] Keyword extraction failed for {text[:30]}: {e}")
-            return [], 'en'
-        
-        # Detect language using fastText
-        language = 'en'
-        try:
-            # limit text length for detection
-            if len(text) > 100:
-                text = text[:100]
-
-            lang_result = detect_language(text)
-            if lang_result:
-                language, confidence = lang_result
-        except Exception as e:
-            logger.warning(f"[NEWS] Language detection failed for {text[:30]}: {e}")
-        
-        return keywords, language
\ No newline at end of file
+        if self.nlp_pool is not None:
+            return self.nlp_pool.analyze(texts)
+
+        # Batches share one fastText call for their language detection
+        batch_size = self.nlp_batch_size
+        analyses = []
+        for start in range(0, len(texts), batch_size):
+            if self.shutdown_requested.is_set():
+                break
+            analyses.extend(analyze_article_texts(
+                texts[start:start + batch_size], keyword_extractor, model_path=settings.FASTTEXT_MODEL_PATH,
+            ))
+        return analyses
\ No newline at end of file
@@ -10,7 +10,8 @@ from django.conf import settings
 from django.core.management.base import BaseCommand
 
 from news.providers.newsapiorg.client import NewsApiOrgProvider
-from news.models import Source
+from news.models import Article, Source
+from news.snapshots import build_snapshots
 
 logger = logging.getLogger(__name__)
 
@@ -230,6 +231,8 @@ class Command(BaseCommand):
                 new_items = [Source(**p) for p in prepared if p["name"] not in existing_names]
                 updated = 0
                 created = 0
+                # Sources whose country must be copied onto their articles
+                country_changed = {item.name for item in new_items}
                 try:
                     with transaction.atomic():
                         if new_items:
@@ -246,11 +249,20 @@ class Command(BaseCommand):
                                         if getattr(obj, field) != p[field]:
                                             setattr(obj, field, p[field])
                                             changed = True
+                                            if field == "country":
+                                                country_changed.add(obj.name)
                                     if changed:
                                         obj.save()
                                         updated += 1
                                 except Source.DoesNotExist:
                                     continue
+
+                        # Keep the denormalized Article.country in sync
+                        if country_changed:
+                            synced = Article.objects.filter(source__in=country_changed).sync_source_country()
+                            if synced:
+                                # Country snapshots embed the synced rows; the rebuild bumps the content version
+                                transaction.on_commit(build_snapshots)
                 except Exception as e:
                     logger.error(f"[NEWS] Failed to persist sources: {e}", exc_info=True)
 
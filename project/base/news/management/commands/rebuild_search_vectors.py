@@ -0,0 +1,52 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from news.models import Article
+from news.search import full_text_search_supported, refresh_search_vectors
+
+from ._batching import iter_id_batches
+
+logger = logging.getLogger(__name__)
+
+# Configuration constants
+BATCH_SIZE = 5000             # Number of articles updated per statement
+
+
+class Command(BaseCommand):
+    """
+    Populate the stored full-text search vector of articles.
+    Processes rows in primary-key batches so large tables are not locked in one statement.
+    """
+    help = "Build or rebuild Article.search_vector used by the full-text search index"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help=f"Number of articles updated per batch (default: {BATCH_SIZE}).",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Rebuild every article instead of only those without a search vector.",
+        )
+
+    def handle(self, *args, **options):
+        if not full_text_search_supported():
+            self.stderr.write("[NEWS] Full-text search requires PostgreSQL, nothing to do.")
+            return
+
+        batch_size = options.get("batch_size") or BATCH_SIZE
+        queryset = Article.objects.all()
+        if not options.get("all"):
+            queryset = queryset.filter(search_vector__isnull=True)
+
+        self.stdout.write("[NEWS] Rebuilding article search vectors...")
+        updated = 0
+        for ids in iter_id_batches(queryset, batch_size):
+            updated += refresh_search_vectors(Article.objects.filter(id__in=ids))
+            self.stdout.write(f"[NEWS] Updated {updated} articles (last id {ids[-1]})")
+
+        self.stdout.write(f"[NEWS] Search vectors rebuilt for {updated} articles")
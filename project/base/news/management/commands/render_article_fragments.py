@@ -0,0 +1,53 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from news.fragments import refresh_list_fragments
+from news.models import Article
+from news.snapshots import build_snapshots
+
+from ._batching import iter_id_batches
+
+logger = logging.getLogger(__name__)
+
+# Configuration constants
+BATCH_SIZE = 1000             # Number of articles rendered per batch
+
+
+class Command(BaseCommand):
+    """
+    Render and store the list JSON fragment (Article.list_json) of existing articles.
+    Run with --all after changing ArticleListSerializer so stored fragments match its output.
+    """
+    help = "Backfill Article.list_json used by the news list endpoint"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help=f"Number of articles rendered per batch (default: {BATCH_SIZE}).",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Re-render every article instead of only those without a fragment.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options.get("batch_size") or BATCH_SIZE
+        queryset = Article.objects.all()
+        if not options.get("all"):
+            queryset = queryset.filter(list_json__isnull=True)
+
+        self.stdout.write("[NEWS] Rendering article list fragments...")
+        rendered = 0
+        for ids in iter_id_batches(queryset, batch_size):
+            rendered += refresh_list_fragments(Article.objects.filter(id__in=ids), batch_size=batch_size)
+            self.stdout.write(f"[NEWS] Rendered {rendered} articles (last id {ids[-1]})")
+
+        if rendered:
+            # Snapshots embed stored fragments; rebuilding them bumps the content version afterwards,
+            # which retires cached pages (rendered from older data or from the old snapshots)
+            build_snapshots()
+        self.stdout.write(f"[NEWS] Stored list fragments for {rendered} articles")
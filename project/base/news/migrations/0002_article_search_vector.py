@@ -0,0 +1,49 @@
+# Generated by Django 5.2.4 on 2026-10-16 09:12
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_INDEX = django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='news_article_search_gin')
+
+
+def add_search_index(apps, schema_editor):
+    # GIN indexes only exist on PostgreSQL; SQLite (DEBUG) keeps the plain column.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Article = apps.get_model('news', 'Article')
+    schema_editor.add_index(Article, SEARCH_INDEX)
+
+
+def remove_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Article = apps.get_model('news', 'Article')
+    schema_editor.remove_index(Article, SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='article',
+                    index=SEARCH_INDEX,
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(add_search_index, remove_search_index),
+            ],
+        ),
+    ]
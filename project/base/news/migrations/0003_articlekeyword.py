@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-16 10:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0002_article_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleKeyword',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('keyword_normalized', models.CharField(max_length=200)),
+                ('score', models.FloatField(default=0.0)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='keyword_entries', to='news.article')),
+            ],
+            options={
+                'verbose_name': 'Article keyword',
+                'verbose_name_plural': 'Article keywords',
+                'indexes': [models.Index(fields=['keyword_normalized', 'article', 'score'], name='news_articl_keyword_9213ea_idx')],
+                'unique_together': {('article', 'keyword_normalized')},
+            },
+        ),
+    ]
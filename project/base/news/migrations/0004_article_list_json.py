@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-16 11:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0003_articlekeyword'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='list_json',
+            field=models.TextField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.4 on 2026-10-16 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0004_article_list_json'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='country',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['country', 'published_date'], name='news_articl_country_e11f8b_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.4 on 2026-10-16 13:05
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Lower
+
+
+def lowercase_article_codes(apps, schema_editor):
+    """Store category and language in canonical lowercase so filters can use exact, indexed lookups."""
+    Article = apps.get_model('news', 'Article')
+    # Stored list fragments embed the category: drop them so they are re-rendered
+    (
+        Article.objects
+        .annotate(category_lower=Lower('category'))
+        .exclude(category=F('category_lower'))
+        .update(category=Lower('category'), list_json=None)
+    )
+    (
+        Article.objects
+        .annotate(language_lower=Lower('language'))
+        .exclude(language=F('language_lower'))
+        .update(language=Lower('language'))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0005_article_country'),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_article_codes, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(django.db.models.functions.text.Lower('source'), models.F('published_date'), name='news_article_source_lower_idx'),
+        ),
+    ]
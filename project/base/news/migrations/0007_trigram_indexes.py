@@ -0,0 +1,57 @@
+# Generated by Django 5.2.4 on 2026-10-16 13:40
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+AUTHOR_TRGM_INDEX = django.contrib.postgres.indexes.GinIndex(
+    django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('author'), name='gin_trgm_ops'),
+    name='news_article_author_trgm',
+)
+SOURCE_NAME_TRGM_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=['name'], opclasses=['gin_trgm_ops'], name='news_source_name_trgm',
+)
+
+
+def add_trigram_indexes(apps, schema_editor):
+    # pg_trgm only exists on PostgreSQL; SQLite (DEBUG) keeps scanning.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.add_index(apps.get_model('news', 'Article'), AUTHOR_TRGM_INDEX)
+    schema_editor.add_index(apps.get_model('news', 'Source'), SOURCE_NAME_TRGM_INDEX)
+
+
+def remove_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.remove_index(apps.get_model('news', 'Article'), AUTHOR_TRGM_INDEX)
+    schema_editor.remove_index(apps.get_model('news', 'Source'), SOURCE_NAME_TRGM_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0006_lowercase_article_codes'),
+    ]
+
+    operations = [
+        # No-op on other databases
+        TrigramExtension(),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='article',
+                    index=AUTHOR_TRGM_INDEX,
+                ),
+                migrations.AddIndex(
+                    model_name='source',
+                    index=SOURCE_NAME_TRGM_INDEX,
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(add_trigram_indexes, remove_trigram_indexes),
+            ],
+        ),
+    ]
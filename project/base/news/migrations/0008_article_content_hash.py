@@ -0,0 +1,50 @@
+# Generated by Django 5.2.4 on 2026-10-16 15:10
+
+import hashlib
+
+from django.db import migrations, models
+
+BACKFILL_BATCH_SIZE = 1000
+
+# Frozen copy of news.seen_urls.CONTENT_HASH_FIELDS / article_content_hash at the time of this
+# migration: later changes to the ingestion hash must not change what this migration computes.
+CONTENT_HASH_FIELDS = ('title', 'description', 'content', 'author', 'url_to_image', 'published_date')
+
+
+def article_content_hash(article):
+    parts = []
+    for field in CONTENT_HASH_FIELDS:
+        value = article.get(field)
+        if field == 'published_date' and value is not None:
+            value = f"{value.timestamp():.0f}"
+        parts.append('' if value is None else str(value))
+    return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+def backfill_content_hashes(apps, schema_editor):
+    """Hash the stored articles so the next fetch does not treat every known URL as changed."""
+    Article = apps.get_model('news', 'Article')
+    batch = []
+    for values in Article.objects.values('id', *CONTENT_HASH_FIELDS).iterator(chunk_size=BACKFILL_BATCH_SIZE):
+        batch.append(Article(id=values['id'], content_hash=article_content_hash(values)))
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            Article.objects.bulk_update(batch, ['content_hash'])
+            batch = []
+    if batch:
+        Article.objects.bulk_update(batch, ['content_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0007_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=40),
+        ),
+        migrations.RunPython(backfill_content_hashes, migrations.RunPython.noop),
+    ]
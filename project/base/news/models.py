@@ -1,5 +1,45 @@
 from django.db import models
 from django.core.validators import URLValidator
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Concat, Length, Lower, Substr, Upper
+from django.db.models.lookups import GreaterThan
+
+# Number of content characters returned as the list preview
+CONTENT_PREVIEW_LENGTH = 200
+
+
+class ArticleQuerySet(models.QuerySet):
+    """Query helpers for article list responses."""
+
+    def with_content_preview(self, length: int = CONTENT_PREVIEW_LENGTH):
+        """
+        Annotate `content_preview`: the first `length` characters of content, with "..."
+        appended when the content is longer. Computed in SQL so the full body is never loaded.
+        """
+        head = Substr('content', 1, length)
+        return self.annotate(content_preview=models.Case(
+            models.When(
+                GreaterThan(Length(Substr('content', 1, length + 1)), length),
+                then=Concat(head, models.Value('...'), output_field=models.TextField()),
+            ),
+            default=head,
+            output_field=models.TextField(),
+        ))
+
+    def sync_source_country(self) -> int:
+        """Copy the (lowercased) country of each article's Source, matched by name, onto the articles."""
+        country = Source.objects.filter(name=OuterRef('source')).values('country')[:1]
+        return self.update(country=Lower(Subquery(country)))
+
+    def for_listing(self, fields):
+        """Select only the columns needed to serialize `fields` of the list representation."""
+        queryset = self.only(*[f for f in fields if f != 'content_preview'])
+        if 'content_preview' in fields:
+            queryset = queryset.with_content_preview()
+        return queryset
+
 
 class Article(models.Model):
     """
@@ -17,6 +57,8 @@ class Article(models.Model):
     source = models.CharField(max_length=200, db_index=True)
     author = models.CharField(max_length=200, blank=True, null=True)
     url_to_image = models.URLField(max_length=2000, blank=True, null=True)
+    # Country of the source, denormalized from Source.country at ingestion
+    country = models.CharField(max_length=100, blank=True, null=True)
 
     # Processing fields
     published_date = models.DateTimeField(db_index=True)
@@ -26,10 +68,21 @@ class Article(models.Model):
     keywords = models.JSONField(default=list, blank=True)
     language = models.CharField(max_length=10, default="en", db_index=True)
 
+    # Full-text search document over title/description/content (PostgreSQL only)
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+
+    # Pre-rendered ArticleListSerializer JSON, stitched directly into list responses
+    list_json = models.TextField(null=True, blank=True, editable=False)
+
+    # SHA-1 of the provider fields (news.seen_urls.article_content_hash); ingestion only rewrites changed rows
+    content_hash = models.CharField(max_length=40, blank=True, default='', editable=False)
+
     # Metadata
     is_featured = models.BooleanField(default=False, db_index=True)
     is_archived = models.BooleanField(default=False, db_index=True)
 
+    objects = ArticleQuerySet.as_manager()
+
     def __str__(self):
         return self.title[:50] + "..."
     
@@ -41,10 +94,16 @@ class Article(models.Model):
         indexes = [
             models.Index(fields=['title', 'published_date']),
             models.Index(fields=['source', 'published_date']),
+            # Source keeps its display case; case-insensitive filters compare LOWER(source)
+            models.Index(Lower('source'), models.F('published_date'), name='news_article_source_lower_idx'),
             models.Index(fields=['category', 'published_date']),
             models.Index(fields=['language', 'published_date']),
             models.Index(fields=['is_featured', 'published_date']),
-            models.Index(fields=['is_archived', 'published_date'])
+            models.Index(fields=['is_archived', 'published_date']),
+            models.Index(fields=['country', 'published_date']),
+            GinIndex(fields=['search_vector'], name='news_article_search_gin'),
+            # pg_trgm index serving author__icontains (UPPER(author) LIKE UPPER('%term%'))
+            GinIndex(OpClass(Upper('author'), name='gin_trgm_ops'), name='news_article_author_trgm'),
         ]
         
         # prevent duplicate articles from the same source
@@ -74,4 +133,31 @@ class Source(models.Model):
             models.Index(fields=['country']),
             models.Index(fields=['category', 'language', 'country']),
             models.Index(fields=['language', 'country']),
-        ]
\ No newline at end of file
+            # pg_trgm index serving the fuzzy source lookup
+            GinIndex(fields=['name'], opclasses=['gin_trgm_ops'], name='news_source_name_trgm'),
+        ]
+
+
+class ArticleKeyword(models.Model):
+    """
+    Normalized keyword phrase extracted from an article (inverted index over Article.keywords).
+    Stores every word-aligned sub-phrase of each YAKE keyword with the keyword's score.
+    """
+
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='keyword_entries')
+    keyword_normalized = models.CharField(max_length=200)
+    score = models.FloatField(default=0.0)
+
+    def __str__(self):
+        return self.keyword_normalized
+
+    class Meta:
+        verbose_name = "Article keyword"
+        verbose_name_plural = "Article keywords"
+
+        indexes = [
+            # covers the EXISTS/SUM lookups by phrase without touching the table
+            models.Index(fields=['keyword_normalized', 'article', 'score']),
+        ]
+
+        unique_together = [('article', 'keyword_normalized')]
@@ -0,0 +1,200 @@
+import json
+from base64 import b64decode, b64encode
+from collections import OrderedDict
+
+from django.core.paginator import InvalidPage, Page
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class NewsPageNumberPagination(PageNumberPagination):
+    """
+    DRF page-number pagination with an async entry point.
+    `apaginate_queryset` produces the same page (and links) as `paginate_queryset`
+    but counts and fetches rows with the async ORM (`acount`, async iteration).
+    `paginate_count` builds the page envelope from a known row count only.
+    """
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        # Paginator.count is a cached_property: prime it asynchronously
+        paginator.count = await queryset.acount()
+        number = self._validate_page_number(request, paginator)
+
+        bottom = (number - 1) * page_size
+        results = [obj async for obj in queryset[bottom:bottom + page_size]]
+        self._set_page(Page(results, number, paginator))
+        return results
+
+    def paginate_count(self, count, request):
+        """
+        Set up the requested page of a result set of `count` rows whose items are supplied
+        separately (front-page snapshots). Returns the page number, links work as usual.
+        """
+        self.request = request
+        paginator = self.django_paginator_class(range(count), self.get_page_size(request))
+        number = self._validate_page_number(request, paginator)
+        self._set_page(paginator.page(number))
+        return number
+
+    def _validate_page_number(self, request, paginator):
+        page_number = self.get_page_number(request, paginator)
+        try:
+            return paginator.validate_number(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(page_number=page_number, message=str(exc))
+            raise NotFound(msg)
+
+    def _set_page(self, page):
+        self.page = page
+        if page.paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination for the news list.
+
+    Pages are addressed by an opaque cursor holding the (sort field, id) position of the
+    last/first row of the previous page, so every page is a bounded index range scan:
+    - recent: (published_date DESC, id DESC)
+    - oldest: (published_date ASC, id ASC)
+    - title:  (title ASC, id ASC)
+    No total count is computed.
+    """
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    # sort_by -> (field, descending)
+    ORDERINGS = {
+        'recent': ('published_date', True),
+        'oldest': ('published_date', False),
+        'title': ('title', False),
+    }
+
+    def __init__(self, sort_by: str = 'recent'):
+        self.field, self.descending = self.ORDERINGS.get(sort_by, self.ORDERINGS['recent'])
+
+    # --- Cursor encoding ---
+    def encode_cursor(self, obj, reverse: bool) -> str:
+        value = getattr(obj, self.field)
+        if self.field == 'published_date':
+            value = value.isoformat()
+        payload = json.dumps({'v': value, 'id': obj.pk, 'r': reverse}, separators=(',', ':'))
+        return b64encode(payload.encode('utf-8'), altchars=b'-_').decode('ascii')
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(b64decode(encoded.encode('ascii'), altchars=b'-_').decode('utf-8'))
+            value, pk, reverse = payload['v'], int(payload['id']), bool(payload['r'])
+            if self.field == 'published_date':
+                value = parse_datetime(value)
+                if value is None:
+                    raise ValueError('invalid datetime')
+            elif not isinstance(value, str):
+                raise ValueError('invalid value')
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        return value, pk, reverse
+
+    # --- Query building ---
+    def seek_filter(self, value, pk, descending: bool) -> Q:
+        """Rows strictly after (value, pk) in the given direction."""
+        if descending:
+            return Q(**{f'{self.field}__lte': value}) & (
+                Q(**{f'{self.field}__lt': value}) | Q(pk__lt=pk)
+            )
+        return Q(**{f'{self.field}__gte': value}) & (
+            Q(**{f'{self.field}__gt': value}) | Q(pk__gt=pk)
+        )
+
+    def ordering(self, descending: bool):
+        prefix = '-' if descending else ''
+        return (f'{prefix}{self.field}', f'{prefix}id')
+
+    def _page_queryset(self, queryset, request):
+        """Return the sliced queryset for the requested page and the decoded cursor."""
+        self.request = request
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor[2])
+
+        # Walking backwards flips the scan direction, results are flipped back below
+        descending = self.descending != reverse
+        if cursor:
+            value, pk, _ = cursor
+            queryset = queryset.filter(self.seek_filter(value, pk, descending))
+        queryset = queryset.order_by(*self.ordering(descending))
+        return queryset[:self.page_size + 1], cursor
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset, cursor = self._page_queryset(queryset, request)
+        return self._finalize_page(list(queryset), cursor)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """Async variant of `paginate_queryset` using the async ORM."""
+        queryset, cursor = self._page_queryset(queryset, request)
+        return self._finalize_page([obj async for obj in queryset], cursor)
+
+    def _finalize_page(self, results, cursor):
+        reverse = bool(cursor and cursor[2])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        if reverse:
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+
+        self.page = results
+        return results
+
+    # --- Links ---
+    def _link(self, obj, reverse: bool):
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(obj, reverse))
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+        return self._link(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
@@ -0,0 +1,187 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+from newsapi.const import categories
+
+from .helpers import filter_complete_sources
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://newsapi.org/v2"
+DEFAULT_CONCURRENCY = 8      # Requests in flight at once
+DEFAULT_TIMEOUT = 10.0       # Seconds per request (read/write/pool)
+DEFAULT_CONNECT_TIMEOUT = 5.0
+
+# (category, country, page) of one top-headlines request in a fan-out
+HeadlinesRequest = Tuple[Optional[str], Optional[str], int]
+
+
+class NewsApiOrgError(Exception):
+    """NewsAPI answered with `"status": "error"`."""
+
+    def __init__(self, code: Optional[str], message: Optional[str]):
+        super().__init__(f"{code}: {message}")
+        self.code = code
+        self.message = message
+
+
+class AsyncNewsApiOrgProvider:
+    """
+    Asynchronous NewsAPI client built on one pooled keep-alive httpx.AsyncClient.
+    Args:
+        api_key (str): NewsAPI key, sent as the X-Api-Key header.
+        base_url (str): API root (e.g. a staging mirror); tests inject `transport` instead.
+        concurrency (int): Maximum requests in flight (also the connection pool size).
+        timeout (float): Per-request timeout in seconds.
+        transport (httpx.AsyncBaseTransport): Optional transport (e.g. httpx.MockTransport).
+    Use as an async context manager, or call `aclose()` when done.
+    """
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_BASE_URL,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: float = DEFAULT_TIMEOUT,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.categories = categories
+        self.concurrency = max(1, concurrency)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            headers={"X-Api-Key": api_key},
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+            timeout=httpx.Timeout(timeout, connect=min(timeout, DEFAULT_CONNECT_TIMEOUT)),
+            transport=transport,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    # --- Requests ---
+    async def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET `path` with the non-empty `params`; raises for HTTP and NewsAPI errors."""
+        # Created lazily: the semaphore binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        params = {key: value for key, value in params.items() if value is not None}
+        async with self._semaphore:
+            response = await self._client.get(path, params=params)
+
+        try:
+            payload = response.json()
+        except ValueError:
+            response.raise_for_status()
+            raise
+        if isinstance(payload, dict) and payload.get("status") == "error":
+            raise NewsApiOrgError(payload.get("code"), payload.get("message"))
+        response.raise_for_status()
+        return payload if isinstance(payload, dict) else {}
+
+    async def get_top_headlines(
+        self, country: str = 'us', category: str = None, q: str = None, page_size: int = 20, page: int = 1,
+    ) -> List[Dict[str, Any]]:
+        response = await self._get("/top-headlines", {
+            "country": country,
+            "category": category,
+            "q": q,
+            "pageSize": page_size,
+            "page": page,
+        })
+        return response.get("articles", [])
+
+    async def get_everything(
+        self, q: str, from_param: str = None, to: str = None, language: str = 'en',
+        sort_by: str = 'relevancy', page_size: int = 20, page: int = 1,
+    ) -> Dict[str, Any]:
+        return await self._get("/everything", {
+            "q": q,
+            "from": from_param,
+            "to": to,
+            "language": language,
+            "sortBy": sort_by,
+            "pageSize": page_size,
+            "page": page,
+        })
+
+    async def get_sources(self, category: str = None, language: str = None, country: str = None) -> List[Dict[str, Any]]:
+        response = await self._get("/top-headlines/sources", {
+            "category": category,
+            "language": language,
+            "country": country,
+        })
+        # Filter out sources with empty critical fields
+        return filter_complete_sources(response.get("sources", []))
+
+    # --- Fan-out ---
+    async def fetch_top_headlines(
+        self, requests: Iterable[HeadlinesRequest], page_size: int = 20,
+    ) -> Dict[HeadlinesRequest, Any]:
+        """
+        Run top-headlines requests concurrently (bounded by the concurrency cap), e.g. the
+        category x country x page grid of an ingestion round.
+        Returns {(category, country, page): articles}; a failed request maps to its exception
+        so one error does not cancel the others.
+        """
+        requests = list(dict.fromkeys(requests))
+        results = await asyncio.gather(*(
+            self.get_top_headlines(country=country, category=category, page_size=page_size, page=page)
+            for category, country, page in requests
+        ), return_exceptions=True)
+        for (category, country, page), result in zip(requests, results):
+            if isinstance(result, Exception):
+                logger.warning(f"[NEWS] Top headlines request failed ({category}, {country}, page {page}): {result}")
+        return dict(zip(requests, results))
+
+
+class ThreadedNewsApiOrgProvider:
+    """
+    Synchronous facade over AsyncNewsApiOrgProvider with the NewsApiOrgProvider interface.
+    One background thread runs the event loop owning the pooled client, so calls from any
+    number of fetch threads share its keep-alive connections and concurrency cap.
+    Takes the same arguments as AsyncNewsApiOrgProvider; call `close()` when done.
+    """
+    def __init__(self, api_key: str, **client_options):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="newsapi-http", daemon=True)
+        self._thread.start()
+        self.client = self._run(self._create_client(api_key, client_options))
+        self.categories = self.client.categories
+
+    @staticmethod
+    async def _create_client(api_key: str, client_options: Dict[str, Any]) -> AsyncNewsApiOrgProvider:
+        return AsyncNewsApiOrgProvider(api_key=api_key, **client_options)
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def get_top_headlines(self, country: str = 'us', category: str = None, q: str = None, page_size: int = 20, page: int = 1):
+        return self._run(self.client.get_top_headlines(country=country, category=category, q=q, page_size=page_size, page=page))
+
+    def get_everything(self, q: str, from_param: str = None, to: str = None, language: str = 'en', sort_by: str = 'relevancy', page_size: int = 20):
+        return self._run(self.client.get_everything(
+            q=q, from_param=from_param, to=to, language=language, sort_by=sort_by, page_size=page_size,
+        ))
+
+    def get_sources(self, category: str = None, language: str = None, country: str = None):
+        return self._run(self.client.get_sources(category=category, language=language, country=country))
+
+    def fetch_top_headlines(self, requests: Iterable[HeadlinesRequest], page_size: int = 20):
+        return self._run(self.client.fetch_top_headlines(requests, page_size=page_size))
+
+    def close(self) -> None:
+        if not self._loop.is_running():
+            return
+        self._run(self.client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
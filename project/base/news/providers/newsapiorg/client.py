@@ -1,6 +1,9 @@
 from newsapi import NewsApiClient
 from newsapi.const import categories
 
+from .helpers import filter_complete_sources
+
+
 class NewsApiOrgProvider:
     def __init__(self, api_key: str):
         self.client = NewsApiClient(api_key=api_key)
@@ -34,16 +37,6 @@ class NewsApiOrgProvider:
         )
         sources = response.get("sources", []) if isinstance(response, dict) else []
 
-        # Skip early return if no sources
-        if not sources:
-            return []
-
         # Filter out sources with empty critical fields
-        filtered_sources = []
-        for source in sources:
-            has_empty_value = [v for v in source.values() if v == "" or v is None]
-            if not has_empty_value:
-                filtered_sources.append(source)
-
-        return filtered_sources
+        return filter_complete_sources(sources)
 
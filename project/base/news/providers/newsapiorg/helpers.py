@@ -1,6 +1,6 @@
 import logging
 import re
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, List, Optional
 
 try:
     from django.utils import timezone
@@ -19,6 +19,37 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Defaults applied by normalize_articles; code-like fields are stored lowercase
+DEFAULT_CATEGORY = "general"
+DEFAULT_LANGUAGE = "en"
+
+
+def filter_complete_sources(sources: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Keep the sources whose fields are all filled.
+    Args:
+        sources (Iterable[Dict[str, Any]]): Raw sources from NewsAPI.
+    Returns:
+        List[Dict[str, Any]]: Sources without empty or missing values.
+    """
+    return [
+        source for source in sources
+        if not [v for v in source.values() if v == "" or v is None]
+    ]
+
+
+def canonical_code(value: Optional[str]) -> Optional[str]:
+    """
+    Canonical storage form of code-like fields (category, language).
+    Args:
+        value (Optional[str]): Raw value.
+    Returns:
+        Optional[str]: Stripped, lowercased value or None when empty.
+    """
+    if not value:
+        return None
+    return value.strip().lower() or None
+
 def normalize_articles(articles: Iterable[Dict[str, Any]]) -> Iterable[Dict[str, Any]]:
     """
     Normalize raw article data from NewsAPI to a standard format.
@@ -72,13 +103,13 @@ def normalize_articles(articles: Iterable[Dict[str, Any]]) -> Iterable[Dict[str,
             "content": content,
             "description": description,
             "url": url,
-            "category": "general",
+            "category": canonical_code(article.get("category")) or DEFAULT_CATEGORY,
             "source": source,
             "author": author or source,
             "url_to_image": article_img,
             "published_date": published_date,
             "keywords": [],
-            "language": "en",
+            "language": canonical_code(article.get("language")) or DEFAULT_LANGUAGE,
         }
 
 def validate_url_and_date(article: Dict[str, Any]) -> bool:
@@ -0,0 +1,78 @@
+import logging
+
+import msgpack
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+logger = logging.getLogger(__name__)
+
+# orjson emits compact UTF-8 like the stock renderer; UTC datetimes end with "Z"
+# (as in DRF's encoder) and dict subclasses (ReturnDict, OrderedDict) are native.
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+_drf_encoder = JSONEncoder()
+
+
+def _encode_default(obj):
+    """Types orjson/msgpack do not know natively are encoded as DRF's JSONEncoder does."""
+    return _drf_encoder.default(obj)
+
+
+class NewsJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson for list payloads (paginated envelopes with a `results`
+    array, and list items rendered through `render_list_data`).
+    For those it produces the same bytes as DRF's JSONRenderer with the default settings
+    (compact separators, UTF-8, escaped U+2028/U+2029): they hold no floats, whose formatting
+    differs between orjson and the stock encoder (and NaN/Infinity are rejected by orjson).
+    Error responses, any other payload, indented output (`; indent=` in Accept or the
+    browsable API) and values orjson rejects are rendered by the stock renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if not self._is_list_payload(data, renderer_context) or self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+        return self.render_list_data(data)
+
+    def render_list_data(self, data) -> bytes:
+        """Render list data (an envelope or list items) with orjson, as JSONRenderer would."""
+        if not self.compact or self.ensure_ascii:
+            return super().render(data)
+        try:
+            ret = orjson.dumps(data, default=_encode_default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError as e:
+            logger.debug(f"[NEWS] orjson could not encode response, using JSONRenderer: {e}")
+            return super().render(data)
+
+        # Same JavaScript-safety escaping as JSONRenderer
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+    @staticmethod
+    def _is_list_payload(data, renderer_context) -> bool:
+        """Successful paginated list envelope (error responses carry `errors`/`detail` instead)"""
+        response = renderer_context.get('response')
+        if response is not None and (response.exception or response.status_code >= 400):
+            return False
+        return isinstance(data, dict) and isinstance(data.get('results'), list)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    MessagePack renderer (`Accept: application/msgpack`).
+    Values without a native MessagePack type (datetimes, decimals, UUIDs, lazy strings)
+    are encoded like their JSON representation.
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=_encode_default, use_bin_type=True)
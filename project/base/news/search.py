@@ -0,0 +1,263 @@
+import logging
+import operator
+import re
+from datetime import timedelta
+from functools import reduce
+from typing import Any, Dict, Iterable, List
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramWordSimilarity
+from django.db import connection
+from django.db.models import (
+    Case, CharField, Exists, ExpressionWrapper, F, FloatField, OuterRef, Q, Subquery, Sum, Value, When
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .constants import DEFAULT_SEARCH_CONFIG, SEARCH_CONFIG_BY_LANGUAGE
+from .models import ArticleKeyword
+
+logger = logging.getLogger(__name__)
+
+# Keyword phrases are stored and matched with the same tokenization
+KEYWORD_SPLIT_PATTERN = re.compile(r'[\s,]+')
+KEYWORD_STRIP_CHARS = "'\"()[]{}:;,.!?-/"
+KEYWORD_MAX_LENGTH = 200
+
+# Relevance score = text rank + keyword score + recency decay, each weighted
+RELEVANCE_TEXT_WEIGHT = 1.0
+RELEVANCE_KEYWORD_WEIGHT = 0.5
+RELEVANCE_RECENCY_WEIGHT = 0.3
+RELEVANCE_HALF_LIFE_HOURS = 48
+# Article ages (hours) at which the recency decay steps down
+RELEVANCE_RECENCY_STEPS_HOURS = (6, 12, 24, 48, 96, 168, 336, 720)
+
+
+def full_text_search_supported() -> bool:
+    """Full-text search relies on PostgreSQL tsvector support (SQLite is used in DEBUG)."""
+    return connection.vendor == 'postgresql'
+
+
+def search_config_for_language(language: str = None) -> str:
+    """Return the PostgreSQL text search configuration for a language code."""
+    if not language:
+        return DEFAULT_SEARCH_CONFIG
+    return SEARCH_CONFIG_BY_LANGUAGE.get(language.lower(), DEFAULT_SEARCH_CONFIG)
+
+
+def article_search_config():
+    """
+    SQL expression picking the text search configuration from `Article.language`.
+    Evaluated per row, so every article is indexed with the stemmer of its own language.
+    """
+    return Case(
+        *[When(language=lang, then=Value(config)) for lang, config in SEARCH_CONFIG_BY_LANGUAGE.items()],
+        default=Value(DEFAULT_SEARCH_CONFIG),
+        output_field=CharField(),
+    )
+
+
+def build_search_vector():
+    """Weighted tsvector over title (A), description (B) and content (C)."""
+    config = article_search_config()
+    return (
+        SearchVector('title', weight='A', config=config)
+        + SearchVector('description', weight='B', config=config)
+        + SearchVector('content', weight='C', config=config)
+    )
+
+
+def refresh_search_vectors(queryset) -> int:
+    """
+    Recompute the stored `search_vector` for the given articles.
+    Returns the number of updated rows (0 when the database has no full-text support).
+    """
+    if not full_text_search_supported():
+        return 0
+    return queryset.update(search_vector=build_search_vector())
+
+
+def build_search_query(search_term: str, language: str = None):
+    """
+    Build the tsquery for `search_term`.
+    When the language is known the query uses its constant configuration. Otherwise the
+    queries of every configuration in use (SEARCH_CONFIG_BY_LANGUAGE plus the default) are
+    OR-ed together: the tsquery stays constant, so the GIN index on `search_vector` is still
+    used, instead of building a per-row query that forces a sequential scan.
+    """
+    if language:
+        return SearchQuery(search_term, config=search_config_for_language(language), search_type='websearch')
+    configs = sorted({*SEARCH_CONFIG_BY_LANGUAGE.values(), DEFAULT_SEARCH_CONFIG})
+    return reduce(operator.or_, (
+        SearchQuery(search_term, config=config, search_type='websearch') for config in configs
+    ))
+
+
+def apply_full_text_search(queryset, search_term: str, language: str = None):
+    """
+    Filter `queryset` to articles matching `search_term`.
+    Uses the indexed `search_vector` on PostgreSQL and falls back to substring
+    matching on title/content for other databases.
+    """
+    if full_text_search_supported():
+        return queryset.filter(search_vector=build_search_query(search_term, language))
+    return queryset.filter(
+        Q(title__icontains=search_term) | Q(content__icontains=search_term)
+    )
+
+
+def trigram_supported() -> bool:
+    """Trigram operators and indexes rely on the pg_trgm PostgreSQL extension."""
+    return connection.vendor == 'postgresql'
+
+
+def fuzzy_source_lookup(queryset, term: str, limit: int = 10):
+    """
+    Return up to `limit` sources whose name approximately contains `term`, best matches first.
+    PostgreSQL uses trigram word similarity (`%>`, served by news_source_name_trgm);
+    other databases fall back to a case-insensitive substring match ordered by name.
+    """
+    if trigram_supported():
+        return (
+            queryset
+            .annotate(similarity=TrigramWordSimilarity(term, 'name'))
+            .filter(name__trigram_word_similar=term)
+            .order_by('-similarity', 'name')[:limit]
+        )
+    return queryset.filter(name__icontains=term).order_by('name')[:limit]
+
+
+def tokenize_keyword_text(text: str) -> List[str]:
+    """Split text into lowercase tokens stripped of surrounding punctuation."""
+    if not text:
+        return []
+    tokens = (t.strip(KEYWORD_STRIP_CHARS) for t in KEYWORD_SPLIT_PATTERN.split(text.lower()))
+    return [t for t in tokens if t]
+
+
+def normalize_keyword(text: str) -> str:
+    """Canonical form of a keyword phrase as stored in ArticleKeyword.keyword_normalized."""
+    return " ".join(tokenize_keyword_text(text))[:KEYWORD_MAX_LENGTH]
+
+
+def expand_keyword_phrases(keyword: str) -> List[str]:
+    """
+    Return the normalized keyword and all of its word-aligned sub-phrases.
+    e.g. "climate policy vote" -> ["climate policy vote", "climate policy", "policy vote", "climate", ...]
+    This keeps the previous "search phrase contained in keyword" matching at word granularity.
+    """
+    tokens = tokenize_keyword_text(keyword)
+    phrases = []
+    for size in range(len(tokens), 0, -1):
+        for i in range(0, len(tokens) - size + 1):
+            phrase = " ".join(tokens[i : i + size])[:KEYWORD_MAX_LENGTH]
+            if len(phrase) >= 2:
+                phrases.append(phrase)
+    return phrases
+
+
+def build_article_keyword_rows(article_id: int, keywords: Iterable[Any]) -> List[ArticleKeyword]:
+    """
+    Build ArticleKeyword rows from stored YAKE output ([keyword, score] pairs).
+    When a phrase appears several times the best (lowest) YAKE score is kept.
+    """
+    best_scores: Dict[str, float] = {}
+    for entry in keywords or []:
+        try:
+            keyword, score = entry[0], float(entry[1])
+        except (TypeError, ValueError, IndexError):
+            continue
+        if not isinstance(keyword, str):
+            continue
+        for phrase in expand_keyword_phrases(keyword):
+            if phrase not in best_scores or score < best_scores[phrase]:
+                best_scores[phrase] = score
+
+    return [
+        ArticleKeyword(article_id=article_id, keyword_normalized=phrase, score=score)
+        for phrase, score in best_scores.items()
+    ]
+
+
+def sync_article_keywords(keywords_by_article: Dict[int, Iterable[Any]], replace: bool = False) -> int:
+    """
+    Write the keyword index for the given articles ({article_id: keywords}).
+    With `replace`, existing rows of those articles are removed first.
+    Returns the number of rows written.
+    """
+    if not keywords_by_article:
+        return 0
+
+    rows = []
+    for article_id, keywords in keywords_by_article.items():
+        rows.extend(build_article_keyword_rows(article_id, keywords))
+
+    if replace:
+        ArticleKeyword.objects.filter(article_id__in=list(keywords_by_article)).delete()
+    ArticleKeyword.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+    return len(rows)
+
+
+def _keyword_matches(phrases: Iterable[str]):
+    normalized = list({normalize_keyword(p) for p in phrases} - {""})
+    return ArticleKeyword.objects.filter(article=OuterRef('pk'), keyword_normalized__in=normalized)
+
+
+def filter_by_keyword_phrases(queryset, phrases: Iterable[str]):
+    """Keep articles having at least one indexed keyword phrase among `phrases`."""
+    return queryset.filter(Exists(_keyword_matches(phrases)))
+
+
+def annotate_keyword_score(queryset, phrases: Iterable[str], name: str = 'keyword_score'):
+    """
+    Annotate each article with the summed relevance of its matching keyword phrases.
+    YAKE scores are lower-is-better, so each match contributes 1 / (1 + score):
+    more matches and better-scored matches both increase the annotation.
+    """
+    scores = (
+        _keyword_matches(phrases)
+        .order_by()
+        .values('article')
+        .annotate(total=Sum(Value(1.0) / (Value(1.0) + F('score')), output_field=FloatField()))
+        .values('total')
+    )
+    return queryset.annotate(**{
+        name: Coalesce(Subquery(scores, output_field=FloatField()), Value(0.0), output_field=FloatField())
+    })
+
+
+def recency_decay(half_life_hours: float = RELEVANCE_HALF_LIFE_HOURS):
+    """
+    SQL expression in [0, 1] decaying with the age of `published_date`.
+    A step function of 0.5 ** (age / half life) evaluated at RELEVANCE_RECENCY_STEPS_HOURS:
+    comparisons against constants work on every database and use no duration arithmetic.
+    """
+    now = timezone.now()
+    return Case(
+        *[
+            When(published_date__gte=now - timedelta(hours=hours), then=Value(0.5 ** (hours / half_life_hours)))
+            for hours in RELEVANCE_RECENCY_STEPS_HOURS
+        ],
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+
+
+def annotate_relevance(queryset, search_term: str = None, language: str = None,
+                       phrases: Iterable[str] = (), name: str = 'relevance'):
+    """
+    Annotate `name` with the relevance score of each article, computed in SQL:
+    - text rank of `search_term` against `search_vector` (PostgreSQL only, normalized to [0, 1)),
+    - summed YAKE scores of the matching keyword phrases (see annotate_keyword_score),
+    - recency decay on `published_date`.
+    """
+    score = Value(RELEVANCE_RECENCY_WEIGHT) * recency_decay()
+    if search_term and full_text_search_supported():
+        queryset = queryset.annotate(text_rank=SearchRank(
+            F('search_vector'), build_search_query(search_term, language), normalization=32
+        ))
+        score = score + Value(RELEVANCE_TEXT_WEIGHT) * F('text_rank')
+    if phrases:
+        queryset = annotate_keyword_score(queryset, phrases)
+        score = score + Value(RELEVANCE_KEYWORD_WEIGHT) * F('keyword_score')
+    return queryset.annotate(**{name: ExpressionWrapper(score, output_field=FloatField())})
+
@@ -0,0 +1,93 @@
+import hashlib
+import logging
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Article
+
+logger = logging.getLogger(__name__)
+
+# Seen-URL set shared by every fetch thread and cycle: one small cache entry per stored
+# article URL, keyed by a hash of the URL and holding the content hash of the stored row.
+SEEN_URL_KEY_PREFIX = "news:seen-url"
+DEFAULT_SEEN_URL_TIMEOUT = 7 * 86400
+
+# Provider fields covered by Article.content_hash; a change in any of them rewrites the row
+CONTENT_HASH_FIELDS = ('title', 'description', 'content', 'author', 'url_to_image', 'published_date')
+
+
+class ArticleChanges(NamedTuple):
+    """Fetched URLs split by what ingestion has to do with them."""
+    new: List[str]
+    changed: List[str]
+    unchanged: List[str]
+
+
+def article_content_hash(article: Mapping[str, Any]) -> str:
+    """SHA-1 of the provider fields of a normalized article (or of stored Article values)."""
+    parts = []
+    for field in CONTENT_HASH_FIELDS:
+        value = article.get(field)
+        if field == 'published_date' and value is not None:
+            # Timestamps compare equal whatever the timezone representation
+            value = f"{value.timestamp():.0f}"
+        parts.append('' if value is None else str(value))
+    return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+def seen_url_key(url: str) -> str:
+    return f"{SEEN_URL_KEY_PREFIX}:{hashlib.sha1(url.encode('utf-8')).hexdigest()}"
+
+
+def _seen_url_timeout() -> int:
+    return getattr(settings, 'NEWS_SEEN_URL_TIMEOUT', DEFAULT_SEEN_URL_TIMEOUT)
+
+
+def cached_content_hashes(urls: Iterable[str]) -> Dict[str, str]:
+    """Return {url: content hash} for the URLs in the seen-URL set (one get_many round trip)."""
+    keys = {seen_url_key(url): url for url in urls}
+    if not keys:
+        return {}
+    try:
+        found = cache.get_many(list(keys))
+    except Exception as e:
+        logger.warning(f"[NEWS] Seen-URL cache read failed: {e}")
+        return {}
+    return {keys[key]: value for key, value in found.items()}
+
+
+def mark_urls_seen(content_hashes: Mapping[str, str]) -> None:
+    """Record stored article URLs with their content hash ({url: content hash})."""
+    entries = {seen_url_key(url): content_hash for url, content_hash in content_hashes.items()}
+    if not entries:
+        return
+    try:
+        cache.set_many(entries, timeout=_seen_url_timeout())
+    except Exception as e:
+        logger.warning(f"[NEWS] Seen-URL cache write failed: {e}")
+
+
+def classify_articles(content_hashes: Mapping[str, str]) -> ArticleChanges:
+    """
+    Split fetched articles ({url: content hash}) into new, changed and unchanged URLs.
+    The cache answers first: a cached hash equal to the fetched one means unchanged.
+    Every other URL is confirmed against the database, since entries expire, may be evicted
+    or predate a content change; URLs found unchanged there are marked seen again.
+    Cache hits are trusted: URLs are only marked after their rows are committed.
+    """
+    cached = cached_content_hashes(content_hashes)
+    unchanged = [url for url, content_hash in content_hashes.items() if cached.get(url) == content_hash]
+    candidates = [url for url, content_hash in content_hashes.items() if cached.get(url) != content_hash]
+    if not candidates:
+        return ArticleChanges([], [], unchanged)
+
+    stored = dict(Article.objects.filter(url__in=candidates).values_list("url", "content_hash"))
+    confirmed = {url: stored[url] for url in candidates if stored.get(url) == content_hashes[url]}
+    mark_urls_seen(confirmed)
+    return ArticleChanges(
+        new=[url for url in candidates if url not in stored],
+        changed=[url for url in candidates if url in stored and url not in confirmed],
+        unchanged=unchanged + list(confirmed),
+    )
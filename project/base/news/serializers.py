@@ -1,10 +1,18 @@
 from rest_framework import serializers
-from .models import Article
+from .models import Article, CONTENT_PREVIEW_LENGTH, Source
 from .constants import VALID_CATEGORIES, VALID_LANGUAGES, VALID_COUNTRIES
 
 class ArticleListSerializer(serializers.ModelSerializer):
     """Serializer for article list with preview"""
     content_preview = serializers.SerializerMethodField()
+
+    def __init__(self, *args, **kwargs):
+        # Optional subset of Meta.fields to serialize (sparse fieldsets)
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
     
     class Meta:
         model = Article
@@ -14,8 +22,12 @@ class ArticleListSerializer(serializers.ModelSerializer):
         ]
     
     def get_content_preview(self, obj):
-        """Return first 200 characters of content"""
-        return obj.content[:200] + '...' if len(obj.content) > 200 else obj.content
+        """Return first 200 characters of content (precomputed in SQL by `ArticleQuerySet.with_content_preview`)"""
+        preview = getattr(obj, 'content_preview', None)
+        if preview is not None:
+            return preview
+        content = obj.content
+        return content[:CONTENT_PREVIEW_LENGTH] + '...' if len(content) > CONTENT_PREVIEW_LENGTH else content
 
 
 class NewsFilterSerializer(serializers.Serializer):
@@ -41,10 +53,10 @@ class NewsFilterSerializer(serializers.Serializer):
         help_text="Filter by author"
     )
     sort_by = serializers.ChoiceField(
-        choices=['recent', 'oldest', 'title'],
+        choices=['recent', 'oldest', 'title', 'relevance'],
         required=False,
         default='recent',
-        help_text="Sort order: recent, oldest, or title"
+        help_text="Sort order: recent, oldest, title or relevance"
     )
     user_language = serializers.ChoiceField(
         choices=[(lang, lang) for lang in VALID_LANGUAGES],
@@ -64,9 +76,96 @@ class NewsFilterSerializer(serializers.Serializer):
         required=False,
         help_text="Filter articles up to this date (ISO 8601 format)"
     )
+    pagination = serializers.ChoiceField(
+        choices=['page', 'cursor'],
+        required=False,
+        default='page',
+        help_text="Pagination mode: page (numbered pages with count) or cursor (keyset, no count)"
+    )
+    cursor = serializers.CharField(
+        required=False,
+        max_length=1000,
+        help_text="Opaque cursor returned in next/previous links when pagination=cursor"
+    )
+    fields = serializers.CharField(
+        required=False,
+        max_length=500,
+        help_text="Comma-separated subset of list fields to return, e.g. id,title,url,published_date"
+    )
 
     def validate_category(self, value):
-        """Validate category against valid categories"""
+        """Validate category against valid categories (case-insensitive, returned lowercase)"""
+        value = value.strip().lower()
         if value not in VALID_CATEGORIES:
             raise serializers.ValidationError(f"Invalid category. Valid options are: {', '.join(VALID_CATEGORIES)}")
         return value
+
+    def validate(self, attrs):
+        """Relevance scores are not monotonic in any indexed column, so they cannot be keyset-paginated"""
+        if attrs.get('sort_by') == 'relevance' and attrs.get('pagination') == 'cursor':
+            raise serializers.ValidationError("sort_by=relevance is not supported with pagination=cursor.")
+        return attrs
+
+    def validate_fields(self, value):
+        """Validate requested list fields; returned as a tuple in ArticleListSerializer order"""
+        allowed = ArticleListSerializer.Meta.fields
+        requested = {name.strip() for name in value.split(',') if name.strip()}
+        if not requested:
+            raise serializers.ValidationError("At least one field is required.")
+        unknown = requested.difference(allowed)
+        if unknown:
+            raise serializers.ValidationError(
+                f"Invalid fields: {', '.join(sorted(unknown))}. Valid options are: {', '.join(allowed)}"
+            )
+        return tuple(name for name in allowed if name in requested)
+
+    def validate_source(self, value):
+        """Canonical lowercase form, compared against LOWER(source)"""
+        return value.strip().lower()
+
+    def validate_user_language(self, value):
+        """Stored languages are lowercase"""
+        return value.lower()
+
+
+class NewsExportFilterSerializer(NewsFilterSerializer):
+    """Export parameters: the list filters plus an optional resume position"""
+    after_date = serializers.DateTimeField(
+        required=False,
+        help_text="Resume after this published_date (with after_id, taken from the last exported line)"
+    )
+    after_id = serializers.IntegerField(
+        required=False,
+        min_value=0,
+        help_text="Resume after this article id (with after_date)"
+    )
+
+    def validate(self, attrs):
+        """Resume positions need both parts"""
+        attrs = super().validate(attrs)
+        if ('after_date' in attrs) != ('after_id' in attrs):
+            raise serializers.ValidationError("after_date and after_id must be provided together.")
+        return attrs
+
+
+class SourceLookupSerializer(serializers.ModelSerializer):
+    """Serializer for fuzzy source lookup results"""
+    class Meta:
+        model = Source
+        fields = ['name', 'url', 'category', 'language', 'country']
+
+
+class SourceLookupParamsSerializer(serializers.Serializer):
+    """Serializer for source lookup parameters"""
+    q = serializers.CharField(
+        max_length=200,
+        help_text="Partial or misspelled source name"
+    )
+    limit = serializers.IntegerField(
+        required=False,
+        default=10,
+        min_value=1,
+        max_value=50,
+        help_text="Maximum number of sources returned"
+    )
+
@@ -0,0 +1,135 @@
+import logging
+import multiprocessing
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Sequence, Tuple
+
+from ..keyword_extraction.extractor import KeywordExtractorService
+from ..language_detect.detect import detect_languages
+from ..language_detect.model_loader import get_model
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 10
+DEFAULT_MODEL_PATH = "lid.176.ftz"
+# Characters of the article text used for language detection
+DETECTION_TEXT_LENGTH = 100
+
+# (keywords, language) of one article text
+ArticleAnalysis = Tuple[List[Tuple[str, float]], Optional[str]]
+
+
+def extract_article_keywords(text: str, keyword_extractor: KeywordExtractorService) -> List[Tuple[str, float]]:
+    """Keyword extraction (YAKE) for one article text; [] when it fails."""
+    try:
+        # using the keyword extractor service (Yake)
+        return keyword_extractor.extract_keywords(text) or []
+    except Exception as e:
+        logger.warning(f"[NEWS] Keyword extraction failed for {text[:30]}: {e}")
+        return []
+
+
+def analyze_article_texts(
+    texts: Sequence[str], keyword_extractor: KeywordExtractorService, model_path: str = DEFAULT_MODEL_PATH,
+) -> List[ArticleAnalysis]:
+    """
+    Keyword extraction (YAKE) and language detection (fastText) for a batch of article texts.
+    Languages of all texts with keywords are detected with a single batched fastText call.
+    Returns ([], 'en') for texts without keywords; the language falls back to 'en'.
+    """
+    keywords = [extract_article_keywords(text, keyword_extractor) for text in texts]
+    results: List[ArticleAnalysis] = [([], 'en')] * len(texts)
+
+    # limit text length for detection
+    pending = [i for i, text_keywords in enumerate(keywords) if text_keywords]
+    detections = detect_languages([texts[i][:DETECTION_TEXT_LENGTH] for i in pending], model_path=model_path)
+    for i, (language, _confidence) in zip(pending, detections):
+        results[i] = (keywords[i], language or 'en')
+    return results
+
+
+# --- Worker process state ---
+_worker_extractor = None
+_worker_model_path = DEFAULT_MODEL_PATH
+
+
+def _init_worker(model_path: str):
+    """
+    Create the YAKE extractor and load the fastText model once per worker process.
+    Spawned workers do not run NewsConfig.ready(), so the model path comes from the parent.
+    """
+    global _worker_extractor, _worker_model_path
+    # Ctrl+C reaches the whole process group: shutdown is driven by the parent command
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker_extractor = KeywordExtractorService()
+    _worker_model_path = model_path
+    try:
+        get_model(model_path)
+    except Exception as e:
+        # detect_languages logs and retries the load with each batch
+        logger.error(f"[NEWS] NLP worker could not load the fastText model from {model_path}: {e}")
+
+
+def _analyze_batch(texts: Sequence[str]) -> List[ArticleAnalysis]:
+    return analyze_article_texts(texts, _worker_extractor, model_path=_worker_model_path)
+
+
+class ArticleNLPPool:
+    """
+    Process pool running `analyze_article_texts` in batches.
+
+    YAKE is pure Python, so threads fetching different categories serialize on the GIL;
+    worker processes let keyword extraction scale with cores. Workers are started with the
+    `spawn` method (safe alongside the fetch threads and open DB connections) and initialize
+    their extractor and fastText model once. The pool is shared by all fetch threads.
+    A worker crash breaks the whole executor: it is replaced so later cycles get a fresh pool.
+    Args:
+        workers (int): Number of worker processes.
+        batch_size (int): Article texts sent to a worker per task.
+        model_path (str): fastText model loaded by every worker (settings.FASTTEXT_MODEL_PATH).
+    """
+    def __init__(self, workers: int, batch_size: int = DEFAULT_BATCH_SIZE, model_path: str = DEFAULT_MODEL_PATH):
+        self.workers = workers
+        self.batch_size = max(1, batch_size)
+        self.model_path = model_path
+        self._lock = threading.Lock()
+        self._executor = self._create_executor()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(self.model_path,),
+        )
+
+    def analyze(self, texts: Sequence[str]) -> List[ArticleAnalysis]:
+        """
+        Return the analysis of every text, in input order.
+        Raises BrokenProcessPool when a worker died; the executor is replaced before raising.
+        """
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        executor = self._executor
+        results = []
+        try:
+            for batch_results in executor.map(_analyze_batch, batches):
+                results.extend(batch_results)
+        except BrokenProcessPool:
+            self._replace_executor(executor)
+            raise
+        return results
+
+    def _replace_executor(self, broken: ProcessPoolExecutor) -> None:
+        # Fetch threads share the pool: only the first one to notice replaces it
+        with self._lock:
+            if self._executor is not broken:
+                return
+            logger.error("[NEWS] NLP process pool broke (a worker died), starting a new one")
+            self._executor = self._create_executor()
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self, cancel_pending: bool = True) -> None:
+        with self._lock:
+            self._executor.shutdown(wait=True, cancel_futures=cancel_pending)
@@ -1,8 +1,22 @@
 import logging
-from typing import Tuple, Optional
+from typing import List, Optional, Sequence, Tuple
 from .helpers import clean_text
 from .model_loader import get_model
 
+# Texts shorter than this are repeated to improve detection accuracy
+SHORT_TEXT_LENGTH = 20
+
+
+def _prepare_text(text: str) -> Optional[str]:
+    """Cleaned text ready for fastText, or None when nothing is left to detect."""
+    text = clean_text(text)
+    if not text:
+        return None
+    if len(text) < SHORT_TEXT_LENGTH:
+        text = " ".join([text] * 3)
+    return text
+
+
 def detect_language(text: str, min_confidence: float = 0.7, model_path: str = "lid.176.ftz"):
     """
     Detect the language of the given text using fastText.
@@ -12,26 +26,35 @@ def detect_language(text: str, min_confidence: float = 0.7, model_path: str = "l
     - Check against a minimum confidence threshold to filter uncertain detections.
     Returns a tuple of (language_code, confidence) or None, 0.0 if detection fails.
     """
-    try:
-        # Clean the text before detection from special characters and links
-        text = clean_text(text)
-        if not text:
-            return None, 0.0
-
-        # Repeat short texts to improve detection accuracy
-        if len(text) < 20:
-            text = " ".join([text] * 3)
+    return detect_languages([text], min_confidence=min_confidence, model_path=model_path)[0]
 
-        model = get_model(model_path)
-        labels, probabilities = model.predict(text)
-        language = labels[0].replace("__label__", "")
-        confidence = probabilities[0]
 
-        # Check against minimum confidence threshold
-        if confidence < min_confidence:
-            return None, confidence
+def detect_languages(
+    texts: Sequence[str], min_confidence: float = 0.7, model_path: str = "lid.176.ftz"
+) -> List[Tuple[Optional[str], float]]:
+    """
+    Batch variant of `detect_language` with the same cleaning, short-text and threshold rules.
+    Explanation:
+    - Clean every text with the precompiled patterns of `clean_text`.
+    - Send all non-empty texts to a single `model.predict` call.
+    Returns one (language_code, confidence) tuple per input text, in order;
+    (None, confidence) below the threshold and (None, 0.0) for empty texts or failures.
+    """
+    results: List[Tuple[Optional[str], float]] = [(None, 0.0)] * len(texts)
+    try:
+        prepared = [(i, _prepare_text(text)) for i, text in enumerate(texts)]
+        prepared = [(i, text) for i, text in prepared if text]
+        if not prepared:
+            return results
 
-        return language, confidence
+        model = get_model(model_path)
+        labels, probabilities = model.predict([text for _, text in prepared])
+        for (i, _), text_labels, text_probabilities in zip(prepared, labels, probabilities):
+            language = text_labels[0].replace("__label__", "")
+            confidence = float(text_probabilities[0])
+            # Check against minimum confidence threshold
+            results[i] = (language, confidence) if confidence >= min_confidence else (None, confidence)
+        return results
     except Exception as e:
         logging.error(f"Language detection failed: {e}")
-        return None, 0.0
+        return [(None, 0.0)] * len(texts)
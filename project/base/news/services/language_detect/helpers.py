@@ -1,6 +1,13 @@
 import re
 import logging
 
+# Patterns are compiled once; clean_text runs for every detected text
+URL_PATTERN = re.compile(r"http\S+")
+# Expanded Unicode ranges: Latin, Latin Extended, Arabic, Cyrillic, CJK, Devanagari, Greek, Hebrew, Thai, etc.
+DISALLOWED_CHARS_PATTERN = re.compile(r"[^\w\s\u00C0-\u024F\u0600-\u06FF\u0400-\u04FF\u4E00-\u9FFF\u3040-\u30FF\u0900-\u097F\u0370-\u03FF\u0590-\u05FF\u0E00-\u0E7F]")
+# fastText predicts one line per input: line breaks are replaced by spaces
+LINE_BREAK_PATTERN = re.compile(r"[\r\n]+")
+
 def clean_text(text):
     """
     Clean the input text by removing URLs and unwanted characters.
@@ -9,6 +16,7 @@ def clean_text(text):
     - Convert to lowercase for uniformity.
     - Remove URLs to avoid noise in language detection.
     - Use an expanded Unicode range to retain characters from multiple languages/scripts.
+    - Replace line breaks with spaces (fastText rejects multi-line input).
     Returns cleaned text or None if an error occurs.
     """
 
@@ -20,9 +28,9 @@ def clean_text(text):
     
     try:
         text = text.lower()
-        text = re.sub(r"http\S+", "", text)
-        # Expanded Unicode ranges: Latin, Latin Extended, Arabic, Cyrillic, CJK, Devanagari, Greek, Hebrew, Thai, etc.
-        text = re.sub(r"[^\w\s\u00C0-\u024F\u0600-\u06FF\u0400-\u04FF\u4E00-\u9FFF\u3040-\u30FF\u0900-\u097F\u0370-\u03FF\u0590-\u05FF\u0E00-\u0E7F]", "", text)
+        text = URL_PATTERN.sub("", text)
+        text = DISALLOWED_CHARS_PATTERN.sub("", text)
+        text = LINE_BREAK_PATTERN.sub(" ", text)
         return text.strip()
     except Exception as e:
         logging.error(f"Text cleaning error: {e}")
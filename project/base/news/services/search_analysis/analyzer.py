@@ -0,0 +1,232 @@
+import asyncio
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ..language_detect.detect import detect_language
+
+logger = logging.getLogger(__name__)
+
+SHARED_KEY_PREFIX = "news:search-analysis"
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_SHARED_TIMEOUT = 86400
+DEFAULT_EXECUTOR_WORKERS = 4
+
+TOKEN_SPLIT_PATTERN = re.compile(r'[\s,]+')
+
+
+@dataclass(frozen=True)
+class SearchAnalysis:
+    """Result of analyzing a search string.
+    Args:
+        language (Optional[str]): Detected language code, None when below the confidence threshold.
+        confidence (float): Detection confidence.
+        phrases (Tuple[str, ...]): Derived keyword phrases, longer phrases first.
+    """
+    language: Optional[str]
+    confidence: float
+    phrases: Tuple[str, ...]
+
+
+def normalize_search(text: str) -> str:
+    """Canonical cache form of a search string (lowercased, whitespace collapsed)."""
+    return " ".join((text or "").split()).lower()
+
+
+def derive_keyword_phrases(text: str, max_ngram: int = 3, max_phrases: int = 50) -> List[str]:
+    """Derive candidate keyword phrases from `text`.
+
+    - Tokenizes the text on whitespace/punctuation.
+    - Generates n-grams up to `max_ngram`.
+    - Returns phrases sorted by length (longer phrases first) and limited to `max_phrases`.
+    """
+    if not text:
+        return []
+
+    # Normalize whitespace and strip surrounding punctuation from tokens
+    tokens = [t.strip("'\"()[]{}:;,.!?-/") for t in TOKEN_SPLIT_PATTERN.split(text) if t.strip()]
+    if not tokens:
+        return []
+
+    n = min(max_ngram, len(tokens))
+    phrases = set()
+
+    # Generate n-grams (prefer longer n-grams)
+    for size in range(n, 0, -1):
+        for i in range(0, len(tokens) - size + 1):
+            gram = " ".join(tokens[i : i + size]).strip()
+            # skip very short tokens
+            if len(gram) < 2:
+                continue
+            phrases.add(gram)
+
+    # Sort by number of words then by length, prefer longer/more specific phrases
+    sorted_phrases = sorted(phrases, key=lambda p: (-len(p.split()), -len(p)))
+    return sorted_phrases[:max_phrases]
+
+
+class SearchAnalyzer:
+    """Memoized search analysis (language detection + keyword phrase derivation).
+
+    Search terms are heavy-tailed, so results are kept in a bounded in-process LRU and
+    shared between processes through the Django cache (Redis in production).
+    Args:
+        max_entries (int): Maximum number of entries kept in the in-process LRU.
+        shared_timeout (int): Lifetime (seconds) of entries in the shared cache.
+        max_ngram (int): Longest derived phrase, in words.
+        max_phrases (int): Maximum number of derived phrases.
+    """
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        shared_timeout: int = DEFAULT_SHARED_TIMEOUT,
+        max_ngram: int = 4,
+        max_phrases: int = 30,
+    ):
+        self.max_entries = max_entries
+        self.shared_timeout = shared_timeout
+        self.max_ngram = max_ngram
+        self.max_phrases = max_phrases
+        self._entries: "OrderedDict[str, SearchAnalysis]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    def analyze(self, text: str) -> SearchAnalysis:
+        """Return the analysis of `text`, computing it only on a miss in both cache levels."""
+        normalized = normalize_search(text)
+
+        with self._lock:
+            analysis = self._entries.get(normalized)
+            if analysis is not None:
+                self._entries.move_to_end(normalized)
+                self.local_hits += 1
+                return analysis
+
+        shared_key = self._shared_key(normalized)
+        analysis = self._shared_get(shared_key)
+        if analysis is not None:
+            with self._lock:
+                self.shared_hits += 1
+        else:
+            analysis = self._compute(normalized)
+            self._shared_set(shared_key, analysis)
+            with self._lock:
+                self.misses += 1
+
+        self._remember(normalized, analysis)
+        return analysis
+
+    def peek(self, text: str) -> Optional[SearchAnalysis]:
+        """Return the in-process entry for `text` without any I/O, or None."""
+        normalized = normalize_search(text)
+        with self._lock:
+            analysis = self._entries.get(normalized)
+            if analysis is not None:
+                self._entries.move_to_end(normalized)
+                self.local_hits += 1
+            return analysis
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters of this process."""
+        with self._lock:
+            return {
+                "local_hits": self.local_hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        """Drop the in-process entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.local_hits = self.shared_hits = self.misses = 0
+
+    def _compute(self, normalized: str) -> SearchAnalysis:
+        language, confidence = detect_language(normalized)
+        phrases = derive_keyword_phrases(normalized, max_ngram=self.max_ngram, max_phrases=self.max_phrases)
+        return SearchAnalysis(language=language, confidence=float(confidence or 0.0), phrases=tuple(phrases))
+
+    def _remember(self, normalized: str, analysis: SearchAnalysis) -> None:
+        with self._lock:
+            self._entries[normalized] = analysis
+            self._entries.move_to_end(normalized)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _shared_key(normalized: str) -> str:
+        return f"{SHARED_KEY_PREFIX}:{hashlib.sha1(normalized.encode('utf-8')).hexdigest()}"
+
+    def _shared_get(self, key: str) -> Optional[SearchAnalysis]:
+        try:
+            value = cache.get(key)
+        except Exception as e:
+            logger.warning(f"Search analysis cache read failed: {e}")
+            return None
+        if value is None:
+            return None
+        language, confidence, phrases = value
+        return SearchAnalysis(language=language, confidence=confidence, phrases=tuple(phrases))
+
+    def _shared_set(self, key: str, analysis: SearchAnalysis) -> None:
+        try:
+            cache.set(key, (analysis.language, analysis.confidence, list(analysis.phrases)), timeout=self.shared_timeout)
+        except Exception as e:
+            logger.warning(f"Search analysis cache write failed: {e}")
+
+
+_analyzer = None
+_analyzer_lock = threading.Lock()
+_executor = None
+
+
+def get_search_analyzer() -> SearchAnalyzer:
+    """Return the process-wide analyzer configured from settings. Thread-safe."""
+    global _analyzer
+    if _analyzer is None:
+        with _analyzer_lock:
+            if _analyzer is None:
+                _analyzer = SearchAnalyzer(
+                    max_entries=getattr(settings, "SEARCH_ANALYSIS_CACHE_SIZE", DEFAULT_MAX_ENTRIES),
+                    shared_timeout=getattr(settings, "SEARCH_ANALYSIS_CACHE_TIMEOUT", DEFAULT_SHARED_TIMEOUT),
+                )
+    return _analyzer
+
+
+def analyze_search(text: str) -> SearchAnalysis:
+    """Analyze a search string through the process-wide analyzer."""
+    return get_search_analyzer().analyze(text)
+
+
+def get_analysis_executor() -> ThreadPoolExecutor:
+    """Bounded executor running blocking analysis (fastText, cache I/O) for async callers."""
+    global _executor
+    if _executor is None:
+        with _analyzer_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "SEARCH_ANALYSIS_EXECUTOR_WORKERS", DEFAULT_EXECUTOR_WORKERS),
+                    thread_name_prefix="search-analysis",
+                )
+    return _executor
+
+
+async def aanalyze_search(text: str) -> SearchAnalysis:
+    """Async variant of `analyze_search`: LRU hits are answered inline, misses run in the bounded executor."""
+    analyzer = get_search_analyzer()
+    analysis = analyzer.peek(text)
+    if analysis is not None:
+        return analysis
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_analysis_executor(), analyzer.analyze, text)
@@ -0,0 +1,127 @@
+import logging
+from itertools import product
+from typing import Any, Dict, Iterable, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+from .cache import bump_content_version, filter_signature
+from .constants import VALID_CATEGORIES
+from .fragments import collect_fragments, fragment_queryset, render_paginated_fragments
+from .models import Article
+from .pagination import NewsPageNumberPagination
+from .serializers import NewsFilterSerializer
+
+logger = logging.getLogger(__name__)
+
+# Front-page snapshots: the first pages of hot (category, language, country) combinations,
+# materialized after each ingest cycle and served without touching the database.
+SNAPSHOT_KEY_PREFIX = "news:snapshot"
+DEFAULT_SNAPSHOT_PAGES = 3
+DEFAULT_SNAPSHOT_TIMEOUT = 86400
+
+
+def snapshot_key(filters: Dict[str, Any]) -> str:
+    """Cache key of the snapshot for an exact validated filter set."""
+    return f"{SNAPSHOT_KEY_PREFIX}:{filter_signature(filters)}"
+
+
+def snapshot_filter_sets(categories: Optional[Iterable[Optional[str]]] = None) -> List[Dict[str, Any]]:
+    """
+    Return the validated filter sets snapshotted for `categories` (None = every category
+    plus the unfiltered front page), crossed with NEWS_SNAPSHOT_LANGUAGES/COUNTRIES.
+    Filters go through NewsFilterSerializer, so they equal those of a matching request.
+    """
+    if categories is None:
+        categories = [None, *sorted(VALID_CATEGORIES)]
+    languages = [None, *getattr(settings, "NEWS_SNAPSHOT_LANGUAGES", [])]
+    countries = [None, *getattr(settings, "NEWS_SNAPSHOT_COUNTRIES", [])]
+
+    filter_sets = []
+    for category, language, country in product(categories, languages, countries):
+        data = {
+            key: value
+            for key, value in (("category", category), ("user_language", language), ("user_country_code", country))
+            if value
+        }
+        serializer = NewsFilterSerializer(data=data)
+        if not serializer.is_valid():
+            logger.warning(f"[NEWS] Skipping invalid snapshot filters {data}: {serializer.errors}")
+            continue
+        filter_sets.append(serializer.validated_data)
+    return filter_sets
+
+
+def build_snapshot(filters: Dict[str, Any], pages: int, page_size: int) -> Dict[str, Any]:
+    """Materialize the first `pages` pages (most recent first) of the list matching `filters`."""
+    # Imported here: views import this module to serve snapshots
+    from .views import NewsQueryMixin
+
+    query = NewsQueryMixin()
+    queryset = query._apply_filters(Article.objects.all(), filters)
+    queryset = query._apply_sorting(queryset, filters.get("sort_by", "recent"))
+
+    count = queryset.count()
+    fragments = collect_fragments(list(fragment_queryset(queryset)[:pages * page_size]))
+    # Each page is stored as its joined `results` items; page 1 exists even when empty
+    page_items = [
+        b",".join(fragments[start:start + page_size])
+        for start in range(0, max(len(fragments), 1), page_size)
+    ]
+    return {"count": count, "page_size": page_size, "pages": page_items}
+
+
+def build_snapshots(categories: Optional[Iterable[Optional[str]]] = None, bump: bool = True) -> int:
+    """
+    Rebuild and store the snapshots of `categories`. Returns the number of stored snapshots.
+    With `bump`, the content version is bumped once the snapshots are stored: responses cached
+    (and ETags issued) from the previous snapshots are retired only when the new ones are served.
+    Writers call this after committing their rows, instead of bumping on their own.
+    """
+    pages = getattr(settings, "NEWS_SNAPSHOT_PAGES", DEFAULT_SNAPSHOT_PAGES)
+    if not pages:
+        if bump:
+            bump_content_version()
+        return 0
+    page_size = NewsPageNumberPagination.page_size
+    timeout = getattr(settings, "NEWS_SNAPSHOT_TIMEOUT", DEFAULT_SNAPSHOT_TIMEOUT)
+
+    stored = 0
+    for filters in snapshot_filter_sets(categories):
+        try:
+            cache.set(snapshot_key(filters), build_snapshot(filters, pages, page_size), timeout=timeout)
+            stored += 1
+        except Exception as e:
+            logger.warning(f"[NEWS] Failed to build snapshot for {dict(filters)}: {e}")
+    if bump:
+        bump_content_version()
+    return stored
+
+
+def get_snapshot(filters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the snapshot stored for exactly `filters`, or None (also when NEWS_SNAPSHOT_PAGES is 0)."""
+    if filters.get("pagination") != "page" or not getattr(settings, "NEWS_SNAPSHOT_PAGES", DEFAULT_SNAPSHOT_PAGES):
+        return None
+    try:
+        return cache.get(snapshot_key(filters))
+    except Exception as e:
+        logger.warning(f"[NEWS] Snapshot read failed: {e}")
+        return None
+
+
+def render_snapshot_page(paginator, snapshot: Dict[str, Any], request) -> Optional[bytes]:
+    """
+    Render the requested page of `snapshot` into the paginator's envelope.
+    Returns None when the page (or page size) is not covered by the snapshot;
+    raises NotFound for page numbers the full list would reject too.
+    """
+    if paginator.get_page_size(request) != snapshot["page_size"]:
+        return None
+    number = paginator.paginate_count(snapshot["count"], request)
+    if number > len(snapshot["pages"]):
+        return None
+    return render_paginated_fragments(paginator, [snapshot["pages"][number - 1]])
+
+
+aget_snapshot = sync_to_async(get_snapshot, thread_sensitive=False)
@@ -1,3 +1,799 @@
-from django.test import TestCase
+import asyncio
+import gzip
+import json
+from datetime import timedelta
+from datetime import timezone as dt_timezone
+from io import StringIO
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
 
-# Create your tests here.
\ No newline at end of file
+import httpx
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework.throttling import BaseThrottle
+
+from .cache import bump_content_version
+from .compression import available_encodings, negotiate_encoding
+from .fragments import collect_fragments, fragment_queryset, refresh_list_fragments, render_paginated_fragments
+from .management.commands.fetch_provider_articles import Command as FetchCommand
+from .management.commands.fetch_provider_sources import Command as SourcesCommand
+from .models import Article, Source
+from .pagination import KeysetPagination, NewsPageNumberPagination
+from .providers.newsapiorg.async_client import AsyncNewsApiOrgProvider, NewsApiOrgError, ThreadedNewsApiOrgProvider
+from .providers.newsapiorg.helpers import canonical_code, normalize_articles
+from .search import sync_article_keywords
+from .seen_urls import (
+    CONTENT_HASH_FIELDS, article_content_hash, cached_content_hashes, classify_articles, mark_urls_seen
+)
+from .serializers import ArticleListSerializer
+from .services.search_analysis.analyzer import SearchAnalysis
+from .snapshots import build_snapshots
+from .views import NewsExportView
+
+NEWS_URL = reverse("news:news-retrieval-with-filters")
+EXPORT_URL = reverse("news:news-export")
+ASYNC_URL = reverse("news:news-retrieval-async")
+
+
+def create_article(number, **fields):
+    values = {
+        "title": f"Headline {number}",
+        "content": f"Content of article {number}",
+        "description": f"Description {number}",
+        "url": f"https://example.com/news/{number}",
+        "source": "Example News",
+        "author": "Jane Doe",
+        "published_date": timezone.now(),
+    }
+    values.update(fields)
+    return Article.objects.create(**values)
+
+
+def api_request(params=None):
+    return Request(APIRequestFactory().get("/api/news/", params or {}))
+
+
+class NewsAPITestCase(TestCase):
+    """Request-level tests: the response cache, content version and snapshots start empty."""
+
+    def setUp(self):
+        cache.clear()
+
+    def get_json(self, url, params=None, **headers):
+        response = self.client.get(url, params, headers=headers)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+
+class KeysetPaginationTests(NewsAPITestCase):
+    """Cursor encoding and page walking of the keyset pagination."""
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        # Two articles share a timestamp: the id breaks the tie
+        dates = [now, now - timedelta(hours=1), now - timedelta(hours=1), now - timedelta(hours=2), now - timedelta(hours=3)]
+        for number, published_date in enumerate(dates):
+            create_article(number, published_date=published_date)
+        cls.expected = list(Article.objects.order_by("-published_date", "-id").values_list("id", flat=True))
+
+    def paginate(self, params=None, sort_by="recent"):
+        paginator = KeysetPagination(sort_by=sort_by)
+        paginator.page_size = 2
+        page = paginator.paginate_queryset(Article.objects.all(), api_request(params))
+        return paginator, [article.pk for article in page]
+
+    def cursor_params(self, link):
+        return {"cursor": parse_qs(urlparse(link).query)["cursor"][0]}
+
+    def test_cursor_round_trip(self):
+        paginator = KeysetPagination()
+        article = Article.objects.get(pk=self.expected[1])
+        cursor = paginator.encode_cursor(article, reverse=True)
+
+        value, pk, reverse = paginator.decode_cursor(api_request({"cursor": cursor}))
+        self.assertEqual((value, pk, reverse), (article.published_date, article.pk, True))
+
+    def test_forward_walk_visits_every_row_once_in_order(self):
+        seen = []
+        paginator, page = self.paginate()
+        self.assertIsNone(paginator.get_previous_link())
+        seen.extend(page)
+        while paginator.get_next_link():
+            paginator, page = self.paginate(self.cursor_params(paginator.get_next_link()))
+            seen.extend(page)
+        self.assertEqual(seen, self.expected)
+
+    def test_previous_link_flips_back_to_the_previous_page(self):
+        first, first_page = self.paginate()
+        second, second_page = self.paginate(self.cursor_params(first.get_next_link()))
+        self.assertEqual(second_page, self.expected[2:4])
+
+        back, back_page = self.paginate(self.cursor_params(second.get_previous_link()))
+        self.assertEqual(back_page, first_page)
+        self.assertIsNone(back.get_previous_link())
+        self.assertEqual(self.cursor_params(back.get_next_link()), self.cursor_params(first.get_next_link()))
+
+    def test_ascending_order(self):
+        paginator, page = self.paginate(sort_by="oldest")
+        self.assertEqual(page, self.expected[::-1][:2])
+
+    def test_invalid_cursor_is_not_found(self):
+        for cursor in ("not-base64!", "eyJ2IjoxfQ==", KeysetPagination(sort_by="title").encode_cursor(Article(pk=1, title="x"), False)):
+            with self.subTest(cursor=cursor), self.assertRaises(NotFound):
+                self.paginate({"cursor": cursor})
+
+    def test_cursor_mode_walks_the_endpoint(self):
+        # Five rows fit in one page of PAGE_SIZE (50)
+        body = self.get_json(NEWS_URL, {"pagination": "cursor"})
+        self.assertEqual(list(body), ["next", "previous", "results"])
+        self.assertEqual([item["id"] for item in body["results"]], self.expected)
+        self.assertIsNone(body["next"])
+        self.assertIsNone(body["previous"])
+
+    def test_cursor_mode_rejects_invalid_cursors(self):
+        response = self.client.get(NEWS_URL, {"pagination": "cursor", "cursor": "garbage"})
+        self.assertEqual(response.status_code, 404)
+
+
+class FragmentRenderingTests(NewsAPITestCase):
+    """Stored and stitched fragments must match the serializer + JSONRenderer byte for byte."""
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        create_article(1, published_date=now, content="x" * 500)
+        create_article(2, published_date=now - timedelta(minutes=1), author=None, title="Ünïcode — «quotes» \u2028 \"escaped\"")
+        create_article(3, published_date=now - timedelta(minutes=2), url_to_image="https://example.com/image.jpg")
+        refresh_list_fragments(Article.objects.filter(url__in=[
+            "https://example.com/news/1", "https://example.com/news/2",
+        ]))
+
+    def expected_page(self, request):
+        paginator = NewsPageNumberPagination()
+        queryset = Article.objects.order_by("-published_date", "-id").for_listing(ArticleListSerializer.Meta.fields)
+        page = paginator.paginate_queryset(queryset, request)
+        return JSONRenderer().render(paginator.get_paginated_response(ArticleListSerializer(page, many=True).data).data)
+
+    def test_stored_fragments_match_serializer(self):
+        for article in Article.objects.exclude(list_json=None).for_listing(ArticleListSerializer.Meta.fields):
+            stored = Article.objects.values_list("list_json", flat=True).get(pk=article.pk)
+            with self.subTest(article=article.pk):
+                self.assertEqual(stored.encode("utf-8"), JSONRenderer().render(ArticleListSerializer(article).data))
+
+    def test_stitched_page_matches_serializer_page(self):
+        # Article 3 has no stored fragment and is rendered on the fly
+        request = api_request()
+        paginator = NewsPageNumberPagination()
+        page = paginator.paginate_queryset(fragment_queryset(Article.objects.order_by("-published_date", "-id")), request)
+
+        self.assertEqual(render_paginated_fragments(paginator, collect_fragments(page)), self.expected_page(api_request()))
+
+    def test_endpoint_serves_the_serializer_bytes(self):
+        response = self.client.get(NEWS_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, self.expected_page(api_request()))
+
+    def test_endpoint_uses_stored_fragments(self):
+        # A stored fragment is served as-is, without serializing the row again
+        article = Article.objects.get(url="https://example.com/news/1")
+        stored = JSONRenderer().render({"id": article.pk, "title": "Stored fragment"}).decode("utf-8")
+        Article.objects.filter(pk=article.pk).update(list_json=stored)
+
+        body = self.get_json(NEWS_URL)
+        self.assertIn({"id": article.pk, "title": "Stored fragment"}, body["results"])
+
+
+class SourceCountryTests(NewsAPITestCase):
+    """Article.country mirrors Source.country and backs user_country_code."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Source.objects.create(name="BBC News", url="https://bbc.example", country="GB")
+        Source.objects.create(name="CNN", url="https://cnn.example", country="us")
+        cls.bbc = create_article(1, source="BBC News")
+        cls.cnn = create_article(2, source="CNN")
+
+    def country_ids(self, country):
+        body = self.get_json(NEWS_URL, {"user_country_code": country})
+        return [item["id"] for item in body["results"]]
+
+    def test_backfill_copies_lowercased_source_country(self):
+        call_command("backfill_article_countries", stdout=StringIO())
+
+        self.assertEqual(
+            dict(Article.objects.values_list("source", "country")),
+            {"BBC News": "gb", "CNN": "us"},
+        )
+        self.assertEqual(self.country_ids("gb"), [self.bbc.pk])
+        self.assertEqual(self.country_ids("us"), [self.cnn.pk])
+
+    def test_source_country_change_resyncs_articles_and_snapshots(self):
+        call_command("backfill_article_countries", stdout=StringIO())
+        # user_country_code=us is a snapshotted combination (NEWS_SNAPSHOT_COUNTRIES)
+        self.assertEqual(self.country_ids("us"), [self.cnn.pk])
+
+        provider = mock.Mock()
+        provider.get_sources.return_value = [
+            {"name": "BBC News", "url": "https://bbc.example", "category": "general", "language": "en", "country": "us"},
+        ]
+        command = SourcesCommand(stdout=StringIO(), stderr=StringIO())
+        # No waiting after the cycle
+        command.shutdown_requested.set()
+        with self.captureOnCommitCallbacks(execute=True):
+            command.process_fetch_cycle(provider, {"category": "general"})
+
+        self.assertEqual(Article.objects.get(pk=self.bbc.pk).country, "us")
+        self.assertEqual(self.country_ids("us"), [self.cnn.pk, self.bbc.pk])
+        self.assertEqual(self.country_ids("gb"), [])
+
+
+class ConditionalRequestTests(NewsAPITestCase):
+    """ETag / Last-Modified validators derived from the content version."""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_article(1, category="technology")
+
+    def setUp(self):
+        super().setUp()
+        # Last-Modified is the time of the last bump
+        bump_content_version()
+
+    def test_validators_on_200(self):
+        response = self.client.get(NEWS_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Last-Modified", response)
+        self.assertIn("no-cache", response["Cache-Control"])
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_matching_if_none_match_is_answered_without_queries(self):
+        etag = self.client.get(NEWS_URL)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(NEWS_URL, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+    def test_matching_if_modified_since(self):
+        last_modified = self.client.get(NEWS_URL)["Last-Modified"]
+        response = self.client.get(NEWS_URL, headers={"If-Modified-Since": last_modified})
+        self.assertEqual(response.status_code, 304)
+
+    def test_ingestion_bump_changes_the_etag(self):
+        etag = self.client.get(NEWS_URL)["ETag"]
+        bump_content_version()
+
+        response = self.client.get(NEWS_URL, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_identifies_the_representation(self):
+        etag = self.client.get(NEWS_URL, {"category": "technology"})["ETag"]
+        self.assertEqual(self.client.get(NEWS_URL, {"category": "technology"})["ETag"], etag)
+
+        others = {self.client.get(NEWS_URL, params)["ETag"] for params in ({}, {"sort_by": "oldest"})}
+        self.assertNotIn(etag, others)
+        self.assertEqual(len(others), 2)
+
+
+class SnapshotTests(NewsAPITestCase):
+    """Front-page snapshots served without queries and refreshed by writers."""
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        for number in range(3):
+            create_article(number, category="technology", published_date=now - timedelta(minutes=number))
+        create_article(3, category="sports", published_date=now)
+        refresh_list_fragments(Article.objects.all())
+
+    def test_snapshot_page_is_served_without_queries(self):
+        build_snapshots()
+        with self.assertNumQueries(0):
+            from_snapshot = self.client.get(NEWS_URL, {"category": "technology"})
+        self.assertEqual(from_snapshot.status_code, 200)
+
+        # Same bytes as the query path
+        cache.clear()
+        with self.settings(NEWS_SNAPSHOT_PAGES=0):
+            from_query = self.client.get(NEWS_URL, {"category": "technology"})
+        self.assertEqual(from_snapshot.content, from_query.content)
+
+    def test_other_filters_use_the_query_path(self):
+        build_snapshots()
+        with self.assertNumQueries(2):
+            # COUNT + page (author is never snapshotted)
+            body = self.get_json(NEWS_URL, {"category": "technology", "author": "jane"})
+        self.assertEqual(body["count"], 3)
+
+    def test_fetch_round_refreshes_written_categories_once(self):
+        build_snapshots()
+        etag = self.client.get(NEWS_URL, {"category": "technology"})["ETag"]
+        article = create_article(4, category="technology")
+
+        command = FetchCommand(stdout=StringIO(), stderr=StringIO())
+        command.refresh_snapshots(set())
+        self.assertEqual(self.client.get(NEWS_URL, {"category": "technology"})["ETag"], etag)
+
+        with mock.patch("news.snapshots.bump_content_version", wraps=bump_content_version) as bump:
+            command.refresh_snapshots({"technology"})
+        bump.assert_called_once_with()
+
+        response = self.client.get(NEWS_URL, {"category": "technology"})
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["results"][0]["id"], article.pk)
+        self.assertEqual(self.get_json(NEWS_URL)["results"][0]["id"], article.pk)
+
+
+class DenyThrottle(BaseThrottle):
+    def allow_request(self, request, view):
+        return False
+
+    def wait(self):
+        return 30
+
+
+class NewsExportTests(NewsAPITestCase):
+    """NDJSON export streaming, resume positions, sparse lines and the DRF policies."""
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        # Two articles share a timestamp: the id breaks the tie
+        dates = [now - timedelta(hours=3), now - timedelta(hours=2), now - timedelta(hours=2), now - timedelta(hours=1)]
+        for number, published_date in enumerate(dates):
+            create_article(number, published_date=published_date, category="technology" if number % 2 else "sports")
+        cls.expected = list(Article.objects.order_by("published_date", "id").values_list("id", flat=True))
+
+    async def export(self, params=None, **headers):
+        response = await self.async_client.get(EXPORT_URL, params or {}, headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        content = b"".join([chunk async for chunk in response.streaming_content])
+        self.assertTrue(content.endswith(b"\n"))
+        return [json.loads(line) for line in content.splitlines()]
+
+    async def test_exports_every_article_in_publication_order(self):
+        lines = await self.export(Accept="application/x-ndjson")
+        self.assertEqual([line["id"] for line in lines], self.expected)
+        self.assertEqual(list(lines[0]), ArticleListSerializer.Meta.fields)
+
+    async def test_filters_apply(self):
+        lines = await self.export({"category": "Technology"})
+        self.assertEqual({line["category"] for line in lines}, {"technology"})
+
+    async def test_resume_after_the_last_received_line(self):
+        with self.settings(NEWS_EXPORT_CHUNK_SIZE=1):
+            lines = await self.export()
+        for position in range(len(lines)):
+            last = lines[position]
+            with self.subTest(after_id=last["id"]):
+                resumed = await self.export({"after_date": last["published_date"], "after_id": last["id"]})
+                self.assertEqual([line["id"] for line in resumed], self.expected[position + 1:])
+
+    async def test_resume_position_needs_both_parts(self):
+        response = await self.async_client.get(EXPORT_URL, {"after_id": 1})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("errors", json.loads(response.content))
+
+    async def test_fields_narrow_lines_and_keep_the_resume_position(self):
+        lines = await self.export({"fields": "title,url"})
+        self.assertEqual(list(lines[0]), ["id", "title", "url", "published_date"])
+        self.assertEqual([line["id"] for line in lines], self.expected)
+
+    async def test_throttle_classes_apply(self):
+        with mock.patch.object(NewsExportView, "throttle_classes", [DenyThrottle]):
+            response = await self.async_client.get(EXPORT_URL)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "30")
+
+
+class CaseInsensitiveFilterTests(NewsAPITestCase):
+    """category/source/language are canonicalized to lowercase and matched exactly."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.bbc = create_article(1, source="BBC News", category="technology", language="en")
+        cls.other = create_article(2, source="Example News", category="sports", language="en-us")
+
+    def result_ids(self, params):
+        return [item["id"] for item in self.get_json(NEWS_URL, params)["results"]]
+
+    def test_category_input_is_canonicalized(self):
+        for category in ("technology", "Technology", " TECHNOLOGY "):
+            with self.subTest(category=category):
+                self.assertEqual(self.result_ids({"category": category}), [self.bbc.pk])
+        self.assertEqual(self.client.get(NEWS_URL, {"category": "tech"}).status_code, 400)
+
+    def test_source_matches_case_insensitively_and_keeps_its_display_case(self):
+        for source in ("BBC News", "bbc news", "BBC NEWS "):
+            with self.subTest(source=source):
+                body = self.get_json(NEWS_URL, {"source": source})
+                self.assertEqual([item["id"] for item in body["results"]], [self.bbc.pk])
+                self.assertEqual(body["results"][0]["source"], "BBC News")
+
+    def test_user_language_is_lowercased(self):
+        self.assertEqual(self.result_ids({"user_language": "en-US"}), [self.other.pk])
+        self.assertEqual(self.result_ids({"user_language": "en"}), [self.bbc.pk])
+
+    def test_ingestion_stores_lowercase_codes(self):
+        raw = stub_article("https://example.com/news/raw", category=" Technology", language="EN")
+        article = next(iter(normalize_articles([raw])))
+        self.assertEqual((article["category"], article["language"]), ("technology", "en"))
+        self.assertIsNone(canonical_code("  "))
+
+
+class AcceptEncodingTests(SimpleTestCase):
+    """Content coding negotiation of the list responses."""
+
+    def negotiate(self, header):
+        return negotiate_encoding(RequestFactory().get(NEWS_URL, headers={"Accept-Encoding": header}))
+
+    def test_negotiation(self):
+        preferred = available_encodings()[0]
+        cases = {
+            "": None,
+            "identity": None,
+            "gzip": "gzip",
+            "GZIP ;Q=1": "gzip",
+            "gzip;q=0": None,
+            "gzip;q=invalid": None,
+            "*": preferred,
+            "*, gzip;q=0": "br" if preferred == "br" else None,
+            "br;q=0, gzip": "gzip",
+        }
+        for header, expected in cases.items():
+            with self.subTest(header=header):
+                self.assertEqual(self.negotiate(header), expected)
+
+
+class CompressionTests(NewsAPITestCase):
+    """gzip/brotli list responses and their cached representations."""
+
+    @classmethod
+    def setUpTestData(cls):
+        for number in range(5):
+            create_article(number, content="Lorem ipsum dolor sit amet. " * 20)
+
+    def test_gzip_body_decompresses_to_the_identity_body(self):
+        identity = self.client.get(NEWS_URL)
+        self.assertNotIn("Content-Encoding", identity)
+
+        compressed = self.client.get(NEWS_URL, headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(compressed["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", compressed["Vary"])
+        self.assertEqual(gzip.decompress(compressed.content), identity.content)
+        # Each coding is a separate representation
+        self.assertNotEqual(compressed["ETag"], identity["ETag"])
+
+    def test_cache_hits_reuse_the_compressed_bytes(self):
+        first = self.client.get(NEWS_URL, headers={"Accept-Encoding": "gzip"})
+        with mock.patch("news.views.compress_content") as compress:
+            second = self.client.get(NEWS_URL, headers={"Accept-Encoding": "gzip"})
+        compress.assert_not_called()
+        self.assertEqual(second.content, first.content)
+
+    def test_small_bodies_are_sent_uncompressed(self):
+        with self.settings(NEWS_COMPRESSION_MIN_SIZE=10 ** 6):
+            response = self.client.get(NEWS_URL, headers={"Accept-Encoding": "gzip"})
+        self.assertNotIn("Content-Encoding", response)
+        self.assertEqual(response.json()["count"], 5)
+
+
+class SparseFieldsTests(NewsAPITestCase):
+    """The `fields` parameter narrows the serialized items and the loaded columns."""
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        for number in range(3):
+            create_article(number, published_date=now - timedelta(hours=number))
+
+    def test_items_carry_only_the_requested_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            body = self.get_json(NEWS_URL, {"fields": "title,id"})
+        self.assertEqual(body["count"], 3)
+        for item in body["results"]:
+            # Serializer order, not request order
+            self.assertEqual(list(item), ["id", "title"])
+        self.assertFalse(any('"content"' in query["sql"] for query in queries.captured_queries))
+
+    def test_unknown_fields_are_rejected(self):
+        response = self.client.get(NEWS_URL, {"fields": "id,body"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("fields", response.json()["errors"])
+
+    def test_cursor_mode_with_fields(self):
+        with mock.patch.object(KeysetPagination, "page_size", 2):
+            body = self.get_json(NEWS_URL, {"pagination": "cursor", "fields": "url"})
+            self.assertEqual([list(item) for item in body["results"]], [["url"], ["url"]])
+            # The keyset column is loaded for the cursor even though it is not serialized
+            self.assertIsNotNone(body["next"])
+            rest = self.get_json(body["next"])
+        self.assertEqual([item["url"] for item in rest["results"]], ["https://example.com/news/2"])
+
+    async def test_async_endpoint_honours_fields(self):
+        response = await self.async_client.get(ASYNC_URL, {"fields": "id,published_date"})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["count"], 3)
+        self.assertEqual([list(item) for item in body["results"]], [["id", "published_date"]] * 3)
+
+
+class RelevanceSortTests(NewsAPITestCase):
+    """sort_by=relevance: SQL score of keyword matches and recency, limited to the top K."""
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        cls.recent = create_article(1, title="Solar farm opens", published_date=now - timedelta(hours=1))
+        cls.older = create_article(2, title="Solar panel prices", published_date=now - timedelta(hours=30))
+        cls.oldest = create_article(3, title="Solar subsidies", published_date=now - timedelta(days=5))
+        # YAKE scores are lower-is-better: the oldest article is the strongest keyword match
+        sync_article_keywords({
+            cls.recent.pk: [["solar farm", 5.0]],
+            cls.older.pk: [["solar panel", 2.0]],
+            cls.oldest.pk: [["solar", 0.01]],
+        })
+
+    def ids(self, params):
+        return [item["id"] for item in self.get_json(NEWS_URL, params)["results"]]
+
+    def test_without_search_the_recency_decay_orders(self):
+        self.assertEqual(
+            self.ids({"sort_by": "relevance"}),
+            [self.recent.pk, self.older.pk, self.oldest.pk],
+        )
+
+    def test_keyword_scores_outrank_recency(self):
+        analysis = SearchAnalysis(language=None, confidence=0.0, phrases=("solar",))
+        with mock.patch("news.views.analyze_search", return_value=analysis):
+            self.assertEqual(
+                self.ids({"search": "solar", "sort_by": "relevance"}),
+                [self.oldest.pk, self.recent.pk, self.older.pk],
+            )
+            # The same search sorted by date is unaffected by the scores
+            self.assertEqual(
+                self.ids({"search": "solar", "sort_by": "recent"}),
+                [self.recent.pk, self.older.pk, self.oldest.pk],
+            )
+
+    def test_results_are_limited_to_the_top_k(self):
+        with self.settings(NEWS_RELEVANCE_TOP_K=2):
+            body = self.get_json(NEWS_URL, {"sort_by": "relevance"})
+        self.assertEqual(body["count"], 2)
+        self.assertEqual([item["id"] for item in body["results"]], [self.recent.pk, self.older.pk])
+
+    def test_cursor_pagination_is_rejected(self):
+        response = self.client.get(NEWS_URL, {"sort_by": "relevance", "pagination": "cursor"})
+        self.assertEqual(response.status_code, 400)
+
+
+class ClassifyArticlesTests(NewsAPITestCase):
+    """New/changed/unchanged classification of fetched articles (seen-URL cache + stored hashes)."""
+
+    def setUp(self):
+        super().setUp()
+        self.stored = create_article(1)
+        self.stored_hash = self.hash_of(self.stored)
+        Article.objects.filter(pk=self.stored.pk).update(content_hash=self.stored_hash)
+
+    def hash_of(self, article, **changes):
+        values = {field: getattr(article, field) for field in CONTENT_HASH_FIELDS}
+        values.update(changes)
+        return article_content_hash(values)
+
+    def test_splits_new_changed_and_unchanged(self):
+        new_url = "https://example.com/news/new"
+        changes = classify_articles({
+            self.stored.url: self.stored_hash,
+            new_url: "new-hash",
+        })
+        self.assertEqual(changes.new, [new_url])
+        self.assertEqual(changes.changed, [])
+        self.assertEqual(changes.unchanged, [self.stored.url])
+
+        changed = classify_articles({self.stored.url: self.hash_of(self.stored, title="Updated headline")})
+        self.assertEqual((changed.new, changed.changed, changed.unchanged), ([], [self.stored.url], []))
+
+    def test_unchanged_urls_are_answered_by_the_cache(self):
+        classify_articles({self.stored.url: self.stored_hash})
+        self.assertEqual(cached_content_hashes([self.stored.url]), {self.stored.url: self.stored_hash})
+
+        with self.assertNumQueries(0):
+            changes = classify_articles({self.stored.url: self.stored_hash})
+        self.assertEqual(changes.unchanged, [self.stored.url])
+
+    def test_stale_cache_entries_are_confirmed_against_the_database(self):
+        mark_urls_seen({self.stored.url: "outdated-hash"})
+        changes = classify_articles({self.stored.url: self.stored_hash})
+        self.assertEqual(changes.unchanged, [self.stored.url])
+        self.assertEqual(cached_content_hashes([self.stored.url]), {self.stored.url: self.stored_hash})
+
+        # A cached URL whose row is gone is stored again
+        Article.objects.filter(pk=self.stored.pk).delete()
+        cache.clear()
+        self.assertEqual(classify_articles({self.stored.url: self.stored_hash}).new, [self.stored.url])
+
+    def test_hash_ignores_the_timezone_representation(self):
+        local = self.stored.published_date.astimezone(dt_timezone(timedelta(hours=2)))
+        self.assertEqual(self.hash_of(self.stored, published_date=local), self.stored_hash)
+        self.assertNotEqual(self.hash_of(self.stored, url_to_image="https://example.com/new.jpg"), self.stored_hash)
+
+
+# Stub NewsAPI: an httpx transport answering /top-headlines and /top-headlines/sources from memory
+# with the response shapes the provider clients read (passed as `transport=` to AsyncNewsApiOrgProvider)
+STUB_API_KEY = "stub-key"
+STUB_BASE_URL = "https://newsapi.stub/v2"
+
+
+def stub_error(status_code, code, message):
+    return httpx.Response(status_code, json={"status": "error", "code": code, "message": message})
+
+
+def stub_transport(headlines=None, sources=None, api_key=STUB_API_KEY, on_request=None):
+    """
+    Transport serving NewsAPI-shaped JSON.
+    Args:
+        headlines: Articles per (category, country); pages are cut with pageSize/page.
+            Pairs listed with a None value answer with a 500 error payload.
+        sources: Sources returned by /top-headlines/sources (filtered by category/language/country).
+        api_key: Expected X-Api-Key; other keys get the apiKeyInvalid error payload (401).
+        on_request: Called with every request, e.g. to record them.
+    """
+    headlines = headlines or {}
+    sources = sources or []
+
+    def handler(request):
+        if on_request is not None:
+            on_request(request)
+        if request.headers.get("X-Api-Key") != api_key:
+            return stub_error(401, "apiKeyInvalid", "Your API key is invalid or incorrect.")
+
+        params = request.url.params
+        if request.url.path.endswith("/top-headlines/sources"):
+            matching = [
+                source for source in sources
+                if all(not params.get(key) or source.get(key) == params[key] for key in ("category", "language", "country"))
+            ]
+            return httpx.Response(200, json={"status": "ok", "sources": matching})
+
+        if request.url.path.endswith("/top-headlines"):
+            key = (params.get("category"), params.get("country"))
+            if key in headlines and headlines[key] is None:
+                return stub_error(500, "unexpectedError", "Stub failure.")
+            articles = headlines.get(key, [])
+            page_size = int(params.get("pageSize", 20))
+            page = int(params.get("page", 1))
+            return httpx.Response(200, json={
+                "status": "ok",
+                "totalResults": len(articles),
+                "articles": articles[(page - 1) * page_size:page * page_size],
+            })
+
+        return stub_error(404, "notFound", f"Unknown endpoint {request.url.path}")
+
+    return httpx.MockTransport(handler)
+
+
+def stub_article(url, title="Stub headline", **fields):
+    """Raw NewsAPI article with every field normalize_articles() requires."""
+    article = {
+        "source": {"id": None, "name": "Stub News"},
+        "author": "Stub Author",
+        "title": title,
+        "description": f"{title} description",
+        "url": url,
+        "urlToImage": None,
+        "publishedAt": "2025-01-01T10:00:00Z",
+        "content": f"{title} content",
+    }
+    article.update(fields)
+    return article
+
+
+class AsyncNewsApiOrgProviderTests(SimpleTestCase):
+    """AsyncNewsApiOrgProvider against the in-memory stub NewsAPI."""
+
+    def setUp(self):
+        self.requests = []
+        self.headlines = {
+            ("technology", "us"): [stub_article(f"https://example.com/tech/{i}") for i in range(5)],
+            ("sports", "us"): [stub_article("https://example.com/sports/1")],
+            ("sports", "gb"): None,  # error payload
+        }
+        self.sources = [
+            {"id": "stub", "name": "Stub News", "description": "Stub", "url": "https://stub.example",
+             "category": "general", "language": "en", "country": "us"},
+            {"id": "partial", "name": "Partial", "description": "", "url": "https://partial.example",
+             "category": "general", "language": "en", "country": "us"},
+        ]
+
+    def provider(self, api_key=STUB_API_KEY, **options):
+        transport = stub_transport(self.headlines, self.sources, on_request=self.requests.append)
+        return AsyncNewsApiOrgProvider(api_key, base_url=STUB_BASE_URL, transport=transport, **options)
+
+    def run_async(self, coroutine_function):
+        async def run():
+            async with self.provider() as provider:
+                return await coroutine_function(provider)
+        return asyncio.run(run())
+
+    def test_get_top_headlines_sends_newsapi_parameters(self):
+        articles = self.run_async(lambda p: p.get_top_headlines(country="us", category="technology", page_size=2, page=2))
+
+        self.assertEqual([a["url"] for a in articles], ["https://example.com/tech/2", "https://example.com/tech/3"])
+        request = self.requests[0]
+        self.assertEqual((request.url.host, request.url.path), ("newsapi.stub", "/v2/top-headlines"))
+        self.assertEqual(dict(request.url.params), {"country": "us", "category": "technology", "pageSize": "2", "page": "2"})
+        self.assertEqual(request.headers["X-Api-Key"], STUB_API_KEY)
+
+    def test_get_sources_drops_incomplete_sources(self):
+        sources = self.run_async(lambda p: p.get_sources(country="us"))
+        self.assertEqual([s["id"] for s in sources], ["stub"])
+
+    def test_error_payload_raises(self):
+        async def run():
+            async with self.provider(api_key="wrong") as provider:
+                await provider.get_top_headlines(category="technology")
+
+        with self.assertRaises(NewsApiOrgError) as raised:
+            asyncio.run(run())
+        self.assertEqual(raised.exception.code, "apiKeyInvalid")
+
+    def test_fan_out_keeps_failed_requests_separate(self):
+        grid = [("technology", "us", 1), ("sports", "us", 1), ("sports", "gb", 1), ("technology", "us", 1)]
+        results = self.run_async(lambda p: p.fetch_top_headlines(grid, page_size=3))
+
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual(len(results[("technology", "us", 1)]), 3)
+        self.assertEqual(len(results[("sports", "us", 1)]), 1)
+        self.assertIsInstance(results[("sports", "gb", 1)], NewsApiOrgError)
+
+    def test_concurrency_cap_bounds_requests_in_flight(self):
+        in_flight = []
+        peak = []
+
+        async def slow_get(provider):
+            original = provider._client.get
+
+            async def get(*args, **kwargs):
+                in_flight.append(1)
+                peak.append(len(in_flight))
+                await asyncio.sleep(0.01)
+                in_flight.pop()
+                return await original(*args, **kwargs)
+
+            provider._client.get = get
+            return await provider.fetch_top_headlines([("technology", "us", page) for page in range(1, 9)])
+
+        async def run():
+            async with self.provider(concurrency=2) as provider:
+                return await slow_get(provider)
+
+        asyncio.run(run())
+        self.assertEqual(max(peak), 2)
+
+    def test_threaded_facade_shares_the_client(self):
+        transport = stub_transport(self.headlines, self.sources, on_request=self.requests.append)
+        provider = ThreadedNewsApiOrgProvider(STUB_API_KEY, base_url=STUB_BASE_URL, transport=transport)
+        try:
+            self.assertEqual(len(provider.get_top_headlines(country="us", category="sports")), 1)
+            results = provider.fetch_top_headlines([("technology", "us", 1), ("sports", "gb", 1)], page_size=50)
+        finally:
+            provider.close()
+
+        self.assertEqual(len(results[("technology", "us", 1)]), 5)
+        self.assertIsInstance(results[("sports", "gb", 1)], NewsApiOrgError)
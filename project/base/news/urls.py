@@ -1,10 +1,16 @@
 from django.urls import path
 from .views import (
-    NewsRetrievalWithFiltersView
+    AsyncNewsRetrievalView,
+    NewsExportView,
+    NewsRetrievalWithFiltersView,
+    SourceLookupView
 )
 
 app_name = 'news'
 
 urlpatterns = [
     path('', NewsRetrievalWithFiltersView.as_view(), name='news-retrieval-with-filters'),
+    path('async/', AsyncNewsRetrievalView.as_view(), name='news-retrieval-async'),
+    path('export/', NewsExportView.as_view(), name='news-export'),
+    path('sources/', SourceLookupView.as_view(), name='source-lookup'),
 ]
@@ -1,37 +1,263 @@
 import logging
-import re
 
+from asgiref.sync import sync_to_async
 from rest_framework.generics import GenericAPIView
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.urls import remove_query_param
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.settings import api_settings
+from rest_framework.views import APIView
 
-from django.db.models import Q
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from django.db.models.functions import Lower
+from django.views import View
 
+from .cache import (
+    abuild_response_keys,
+    aget_cached_response,
+    aset_cached_response,
+    build_response_keys,
+    get_cached_response,
+    set_cached_response,
+)
+from .compression import compress_content, negotiate_encoding
+from .fragments import (
+    acollect_fragments,
+    astream_fragment_lines,
+    collect_fragments,
+    fragment_queryset,
+    render_paginated_fragments,
+)
+from .instrumentation import NULL_INSTRUMENTATION, instrument_view
 from .models import Article, Source
+from .pagination import KeysetPagination, NewsPageNumberPagination
+from .renderers import NewsJSONRenderer
 from .serializers import (
     ArticleListSerializer,
-    NewsFilterSerializer
+    NewsExportFilterSerializer,
+    NewsFilterSerializer,
+    SourceLookupParamsSerializer,
+    SourceLookupSerializer
+)
+from .search import (
+    annotate_relevance,
+    apply_full_text_search,
+    filter_by_keyword_phrases,
+    fuzzy_source_lookup,
 )
-from .services.language_detect.detect import detect_language
+from .snapshots import aget_snapshot, get_snapshot, render_snapshot_page
+from .services.search_analysis.analyzer import aanalyze_search, analyze_search
 
 
 logger = logging.getLogger(__name__)
 
 
-class NewsRetrievalWithFiltersView(GenericAPIView):
+class NewsQueryMixin:
+    """Filtering and sorting shared by the sync and async news list views."""
+
+    # Replaced per request by instrument_view when NEWS_INSTRUMENTATION is on
+    instrumentation = NULL_INSTRUMENTATION
+
+    def _apply_filters(self, queryset, filters, analysis=None):
+        """Apply filters to queryset.
+
+        `analysis` is the SearchAnalysis of the search term; it is looked up when not supplied.
+        """
+        # Apply user-provided helpers first to reduce search scope
+        if filters.get('user_language') and filters.get('search') is None:
+            queryset = queryset.filter(language=filters['user_language'])
+
+        # If no user_language provided, use the language detected from search text
+        search_language = None
+        if filters.get('search'):
+            if analysis is None:
+                with self.instrumentation.measure('language'):
+                    analysis = analyze_search(filters['search'])
+            if analysis.language:
+                search_language = analysis.language
+                queryset = queryset.filter(language=search_language.lower())
+
+        if filters.get('user_country_code'):
+            # Source country is denormalized onto Article at ingestion ((country, published_date) index)
+            queryset = queryset.filter(country=filters['user_country_code'].lower())
+
+        # Search filter: use search text for full-text search and derive keywords
+        if filters.get('search'):
+            search_term = filters['search']
+            # Indexed tsvector match on PostgreSQL, substring match elsewhere
+            queryset = apply_full_text_search(queryset, search_term, language=search_language)
+            # Keyword phrases (n-grams) derived from the search string, longer phrases first
+            kw_candidates = analysis.phrases
+            if kw_candidates:
+                # Indexed EXISTS lookup against the normalized ArticleKeyword table
+                queryset = filter_by_keyword_phrases(queryset, kw_candidates)
+        
+        # Category and language are stored lowercase and the serializer canonicalizes inputs,
+        # so exact lookups keep the (column, published_date) indexes usable
+        if filters.get('category'):
+            queryset = queryset.filter(category=filters['category'])
+        
+        # Source filter: matches the LOWER(source) functional index
+        if filters.get('source'):
+            queryset = queryset.alias(source_lower=Lower('source')).filter(source_lower=filters['source'])
+        
+        # Author filter: UPPER(author) LIKE UPPER('%term%'), served by the trigram index on PostgreSQL
+        if filters.get('author'):
+            queryset = queryset.filter(author__icontains=filters['author'])
+        
+        # Date range filters
+        if filters.get('date_from'):
+            queryset = queryset.filter(published_date__gte=filters['date_from'])
+        
+        if filters.get('date_to'):
+            queryset = queryset.filter(published_date__lte=filters['date_to'])
+        
+        
+        return queryset
+
+    def _list_fields(self, filters):
+        """List fields to serialize: the requested sparse fieldset or all of them"""
+        return filters.get('fields') or tuple(ArticleListSerializer.Meta.fields)
+
+    def _projection(self, fields, paginator):
+        """Columns to load for `fields`; keyset cursors also read the sort key of the page edges"""
+        if isinstance(paginator, KeysetPagination) and paginator.field not in fields:
+            return (*fields, paginator.field)
+        return fields
+
+    def _link_base(self, request, paginator):
+        """
+        Absolute request URL without the page parameter, as the paginator links are built from it.
+        Part of the response cache key: cached bodies embed next/previous links, so they are not
+        shared across endpoints (/api/news/ vs /api/news/async/), hosts or extra query parameters.
+        """
+        return remove_query_param(request.build_absolute_uri(), getattr(paginator, 'page_query_param', 'page'))
+
+    def _set_validators(self, response, etag, last_modified):
+        """Attach ETag/Last-Modified and require revalidation on every client poll"""
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified)
+        patch_cache_control(response, no_cache=True)
+        # The representation (and its ETag) depends on the negotiated content coding
+        patch_vary_headers(response, ('Accept-Encoding',))
+        return response
+
+    def _encoded_response(self, content, content_encoding, content_type):
+        """Response carrying `content` as stored in the response cache (compressed or not)"""
+        response = HttpResponse(content, content_type=content_type)
+        if content_encoding:
+            response['Content-Encoding'] = content_encoding
+        return response
+
+    def _apply_sorting(self, queryset, sort_by, filters=None, analysis=None):
+        """Apply sorting to queryset"""
+        if sort_by == 'oldest':
+            return queryset.order_by('published_date')
+        elif sort_by == 'title':
+            return queryset.order_by('title')
+        elif sort_by == 'relevance':
+            return self._apply_relevance(queryset, filters or {}, analysis)
+        else:  # 'recent' is default
+            return queryset.order_by('-published_date')
+
+    def _apply_relevance(self, queryset, filters, analysis=None):
+        """Order by the SQL relevance score (text rank, keyword scores, recency), newest first on ties"""
+        search_term = filters.get('search')
+        language, phrases = None, ()
+        if search_term:
+            if analysis is None:
+                with self.instrumentation.measure('language'):
+                    analysis = analyze_search(search_term)
+            language, phrases = analysis.language, analysis.phrases
+        queryset = annotate_relevance(queryset, search_term, language=language, phrases=phrases)
+        return queryset.order_by('-relevance', '-published_date', '-id')
+
+    def _limit_ranked(self, queryset, filters):
+        """Relevance ordering only pages through the top NEWS_RELEVANCE_TOP_K results"""
+        if filters.get('sort_by') == 'relevance':
+            return queryset[:getattr(settings, 'NEWS_RELEVANCE_TOP_K', 500)]
+        return queryset
+
+
+class APIPolicyMixin:
+    """
+    Authentication, permission and throttle checks of the DRF settings for plain Django views,
+    which do not go through APIView.dispatch (the async and streaming news endpoints).
+    Uses the same classes as every APIView unless overridden on the view.
+    """
+    authentication_classes = api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    permission_classes = api_settings.DEFAULT_PERMISSION_CLASSES
+    throttle_classes = api_settings.DEFAULT_THROTTLE_CLASSES
+
+    def _check_api_policy(self, request):
+        """
+        Return (DRF request, None) when the request passes the checks, or (DRF request, response)
+        with the rendered DRF error response (401/403/429 with its WWW-Authenticate / Retry-After headers).
+        """
+        policy = APIView(
+            authentication_classes=self.authentication_classes,
+            permission_classes=self.permission_classes,
+            throttle_classes=self.throttle_classes,
+        )
+        policy.setup(request, *self.args, **self.kwargs)
+        policy.headers = {}
+        policy.format_kwarg = None
+        drf_request = policy.request = policy.initialize_request(request, *self.args, **self.kwargs)
+        try:
+            policy.perform_authentication(drf_request)
+            policy.check_permissions(drf_request)
+            policy.check_throttles(drf_request)
+        except APIException as exc:
+            response = policy.handle_exception(exc)
+            response.accepted_renderer = NewsJSONRenderer()
+            response.accepted_media_type = NewsJSONRenderer.media_type
+            response.renderer_context = policy.get_renderer_context()
+            return drf_request, response.render()
+        return drf_request, None
+
+    async def _acheck_api_policy(self, request):
+        # Authenticators and throttles use the ORM and the cache synchronously
+        return await sync_to_async(self._check_api_policy)(request)
+
+
+class NewsRetrievalWithFiltersView(NewsQueryMixin, GenericAPIView):
     """
     Comprehensive news retrieval API with advanced filtering and search capabilities.
 
     Behavior notes:
-    - The `search` query parameter performs full-text search against `title` and `content`.
+    - The `search` query parameter performs full-text search against `title`, `description` and `content`.
+        On PostgreSQL it matches the GIN-indexed `search_vector` using the text search configuration
+        of the detected search language; other databases fall back to substring matching.
     - Additionally, the `search` text is tokenized and used to derive keyword phrases (n-grams).
-        These candidate phrases (longer phrases preferred) are matched against the stored
-        `keywords` JSONField entries (which are stored as [keyword, score] pairs). Matching
-        is performed as a case-insensitive substring search of the phrase inside the JSON
-        representation of the keywords list, and candidate phrases are limited to avoid
-        overly broad queries.
+        These candidate phrases (longer phrases preferred) are matched against the normalized
+        `ArticleKeyword` table, which stores every word-aligned sub-phrase of the article's YAKE
+        keywords. Matching is an indexed, case-insensitive EXISTS lookup, and candidate phrases
+        are limited to avoid overly broad queries.
     - If a `search` term is provided, the language of the search term is automatically detected and used to filter results. The `user_language` parameter is only used if no `search` term is provided.
+    - List items are served from `Article.list_json`, the list representation rendered once at
+        ingestion, and stitched into the paginated envelope without running the serializer.
+    - Language detection and phrase derivation for a search term are memoized by the search
+        analysis service (in-process LRU backed by the shared cache).
+    - Responses are cached per canonical filter set and page. Cache keys embed a global content
+        version that ingestion bumps after storing new articles, so stale pages are never served.
+    - The `fields` parameter (sparse fieldset) narrows both the serialized fields and the
+        loaded columns; such requests are serialized instead of using stored fragments.
+    - With NEWS_INSTRUMENTATION on, responses carry a Server-Timing header (SQL count/time,
+        language detection, serialization, rendering) and slow requests are logged with their
+        filter signature and the EXPLAIN plan of their slowest query.
+    - The first pages of hot (category, language, country) combinations are served from
+        snapshots rebuilt after each ingest cycle, when the request filters match exactly.
+    - Responses carry an ETag (derived from the cache key) and Last-Modified (time of the last
+        ingestion bump); matching If-None-Match / If-Modified-Since requests get a 304 without
+        running the page query or the serializer.
+    - Bodies above NEWS_COMPRESSION_MIN_SIZE are compressed with the negotiated Accept-Encoding
+        (brotli when installed, gzip) and cached compressed, so cache hits skip rendering and compression.
 
     Supports filtering by:
     - Category
@@ -46,23 +272,29 @@ class NewsRetrievalWithFiltersView(GenericAPIView):
     queryset = Article.objects.all()
     serializer_class = ArticleListSerializer
 
+    @instrument_view
     def get(self, request, *args, **kwargs):
         """
         Get all articles with optional filtering, sorting, and pagination.
         
         Query Parameters:
                 - search: Search in title and content. Also used to derive keyword phrases (n-grams)
-                    which will be matched against the article `keywords` JSONField. Phrases are
+                    which will be matched against the indexed article keyword phrases. Phrases are
                     generated up to 4 words, longer phrases are preferred, and candidate phrases are
                     limited (default limit: 30) to prevent heavy queries. If a search term is provided, the language of the search term is automatically detected and used to filter results.
         - category: Filter by category
         - source: Filter by source
         - author: Filter by author
         - user_language: Filter by user language (only used if no search term is provided)
-        - user_country_code: Filter by user country code (maps to sources in that country)
-        - sort_by: Sort order (recent, oldest, title)
+        - user_country_code: Filter by user country code (country of the article's source)
+        - sort_by: Sort order (recent, oldest, title, relevance). relevance ranks in SQL by text rank,
+            stored keyword scores and recency, over the top NEWS_RELEVANCE_TOP_K results
         - date_from: Filter from date (ISO 8601)
         - date_to: Filter to date (ISO 8601)
+        - pagination: page (default, numbered pages with count) or cursor (keyset pagination
+            seeking on (published_date, id) or (title, id); returns next/previous cursors, no count)
+        - cursor: opaque cursor taken from the next/previous links in cursor mode
+        - fields: comma-separated subset of list fields (e.g. id,title,url,published_date)
         
         Example: /api/news/?category=Technology&page=1&page_size=20
         """
@@ -76,19 +308,57 @@ class NewsRetrievalWithFiltersView(GenericAPIView):
                 )
             
             filters = filter_serializer.validated_data
+            self.instrumentation.set_filters(filters)
+
+            # Validators and cache key derive from the filter set, the content version and the
+            # negotiated content coding (each coding is a separately cached representation)
+            encoding = negotiate_encoding(request)
+            with self.instrumentation.measure('cache'):
+                cache_key, etag, last_modified = build_response_keys(
+                    filters,
+                    request.query_params.get(self.paginator.page_query_param),
+                    request.accepted_media_type,
+                    self._link_base(request, self.paginator),
+                    encoding,
+                )
+
+            # Answer If-None-Match / If-Modified-Since without running the page query
+            not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if not_modified is not None:
+                return self._set_validators(not_modified, etag, last_modified)
+
+            # Serve identical requests from the versioned response cache (already compressed bytes)
+            with self.instrumentation.measure('cache'):
+                cached = get_cached_response(cache_key)
+            if cached is None:
+                content = None
+                if self._can_use_fragments(request, filters):
+                    # Front pages of hot filter combinations are materialized after each ingest cycle
+                    snapshot = get_snapshot(filters)
+                    if snapshot is not None:
+                        content = render_snapshot_page(self.paginator, snapshot, request)
+                if content is None:
+                    # Build queryset with filters (database operations)
+                    queryset = self._apply_filters(self.get_queryset(), filters)
+
+                    # Apply sorting
+                    queryset = self._apply_sorting(queryset, filters.get('sort_by', 'recent'), filters)
+
+                    # Paginate results using DRF (page numbers) or keyset cursors
+                    paginator = self._get_paginator(filters)
+                    content = self._render_page(request, paginator, queryset, filters)
+
+                with self.instrumentation.measure('compress'):
+                    cached = compress_content(content, encoding)
+                with self.instrumentation.measure('cache'):
+                    set_cached_response(cache_key, cached)
+
+            content, content_encoding = cached
+            response = self._encoded_response(content, content_encoding, request.accepted_renderer.media_type)
+            return self._set_validators(response, etag, last_modified)
             
-            # Build queryset with filters (database operations)
-            queryset = self._apply_filters(self.get_queryset(), filters)
-            
-            # Apply sorting
-            queryset = self._apply_sorting(queryset, filters.get('sort_by', 'recent'))
-            
-            # Paginate results using DRF
-            paginated_queryset = self.paginate_queryset(queryset)
-            serializer = ArticleListSerializer(paginated_queryset, many=True)
-            
-            return self.get_paginated_response(serializer.data)
-            
+        except NotFound:
+            raise
         except Exception as e:
             logger.error(f"Error in news retrieval: {e}", exc_info=True)
             return Response(
@@ -96,106 +366,234 @@ class NewsRetrievalWithFiltersView(GenericAPIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def _apply_filters(self, queryset, filters):
-        """Apply filters to queryset"""
-        # Apply user-provided helpers first to reduce search scope
-        if filters.get('user_language') and filters.get('search') is None:
-            queryset = queryset.filter(language__iexact=filters['user_language'])
+    def _render_page(self, request, paginator, queryset, filters) -> bytes:
+        """Paginate `queryset` and return the rendered response body"""
+        if self._can_use_fragments(request, filters):
+            # Stitch the pre-rendered article JSON into the paginated envelope
+            queryset = self._limit_ranked(fragment_queryset(queryset), filters)
+            page = paginator.paginate_queryset(queryset, request, view=self)
+            with self.instrumentation.measure('serialize'):
+                fragments = collect_fragments(page)
+            with self.instrumentation.measure('render'):
+                return render_paginated_fragments(paginator, fragments)
 
-        # If no user_language provided, try to detect from search text
-        if filters.get('search'):
-            detected = detect_language(filters['search'])
-            print("Detected language from search text:", detected)
-            if detected:
-                lang, _ = detected
-                queryset = queryset.filter(language__iexact=lang)
+        # Load only the serialized columns; the content preview is computed in SQL
+        fields = self._list_fields(filters)
+        queryset = self._limit_ranked(queryset.for_listing(self._projection(fields, paginator)), filters)
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        with self.instrumentation.measure('serialize'):
+            data = ArticleListSerializer(page, many=True, fields=fields).data
+        response = paginator.get_paginated_response(data)
+        with self.instrumentation.measure('render'):
+            return request.accepted_renderer.render(
+                response.data, request.accepted_media_type, self.get_renderer_context()
+            )
 
-        if filters.get('user_country_code'):
-            # Try to map country code to known sources; Article.source is a string name
-            country_code = filters['user_country_code']
-            try:
-                source_names = list(Source.objects.filter(country__iexact=country_code).values_list('name', flat=True))
-                if source_names:
-                    queryset = queryset.filter(source__in=source_names)
-            except Exception:
-                # If Source model lookup fails for any reason, skip country filtering
-                pass
+    def _can_use_fragments(self, request, filters) -> bool:
+        """
+        Stored fragments are compact JSON with every list field; other renderers, indented
+        output or sparse fieldsets go through the serializer
+        """
+        return (
+            isinstance(request.accepted_renderer, JSONRenderer)
+            and 'indent' not in (request.accepted_media_type or '')
+            and not filters.get('fields')
+        )
 
-        # Search filter: use search text for full-text search and derive keywords
+    def _get_paginator(self, filters):
+        """Return the paginator for the requested pagination mode"""
+        if filters.get('pagination') == 'cursor':
+            return KeysetPagination(sort_by=filters.get('sort_by', 'recent'))
+        return self.paginator
+
+
+class AsyncNewsRetrievalView(APIPolicyMixin, NewsQueryMixin, View):
+    """
+    Async-native variant of NewsRetrievalWithFiltersView for the ASGI deployment.
+
+    Accepts the same query parameters and returns the same JSON bodies, but runs without
+    sync_to_async thread hops: rows are counted and fetched with the async ORM
+    (`acount`, async iteration), search language detection runs in the bounded search
+    analysis executor. It uses the same response cache and snapshots, but its cache entries
+    are its own: keys include the request URL, since bodies embed next/previous links.
+    Only JSON is rendered; the DRF authentication, permission and throttle classes apply
+    as on the sync view (APIPolicyMixin).
+    """
+    http_method_names = ['get', 'head', 'options']
+    renderer_class = NewsJSONRenderer
+
+    async def get(self, request, *args, **kwargs):
+        # The DRF request wrapper also provides `query_params` for the paginators
+        drf_request, denied = await self._acheck_api_policy(request)
+        if denied is not None:
+            return self._finalize(denied)
+        try:
+            filter_serializer = NewsFilterSerializer(data=drf_request.query_params)
+            if not filter_serializer.is_valid():
+                return self._json_response({'errors': filter_serializer.errors}, status.HTTP_400_BAD_REQUEST)
+
+            filters = filter_serializer.validated_data
+            paginator = self._get_paginator(filters)
+
+            encoding = negotiate_encoding(request)
+            cache_key, etag, last_modified = await abuild_response_keys(
+                filters,
+                drf_request.query_params.get(getattr(paginator, 'page_query_param', 'page')),
+                self.renderer_class.media_type,
+                self._link_base(request, paginator),
+                encoding,
+            )
+
+            not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if not_modified is not None:
+                return self._finalize(self._set_validators(not_modified, etag, last_modified))
+
+            cached = await aget_cached_response(cache_key)
+            if cached is None:
+                content = None
+                snapshot = await aget_snapshot(filters)
+                if snapshot is not None:
+                    content = render_snapshot_page(paginator, snapshot, drf_request)
+                if content is None:
+                    analysis = None
+                    if filters.get('search'):
+                        analysis = await aanalyze_search(filters['search'])
+
+                    queryset = self._apply_filters(Article.objects.all(), filters, analysis=analysis)
+                    queryset = self._apply_sorting(queryset, filters.get('sort_by', 'recent'), filters, analysis)
+
+                    if filters.get('fields'):
+                        # Sparse fieldset: serialize the requested fields from a narrowed projection
+                        fields = self._list_fields(filters)
+                        queryset = self._limit_ranked(queryset.for_listing(self._projection(fields, paginator)), filters)
+                        page = await paginator.apaginate_queryset(queryset, drf_request, view=self)
+                        data = ArticleListSerializer(page, many=True, fields=fields).data
+                        content = self.renderer_class().render(paginator.get_paginated_response(data).data)
+                    else:
+                        queryset = self._limit_ranked(fragment_queryset(queryset), filters)
+                        page = await paginator.apaginate_queryset(queryset, drf_request, view=self)
+                        content = render_paginated_fragments(paginator, await acollect_fragments(page))
+
+                cached = compress_content(content, encoding)
+                await aset_cached_response(cache_key, cached)
+
+            content, content_encoding = cached
+            response = self._encoded_response(content, content_encoding, self.renderer_class.media_type)
+            return self._finalize(self._set_validators(response, etag, last_modified))
+
+        except NotFound as exc:
+            return self._json_response({'detail': exc.detail}, status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            logger.error(f"Error in async news retrieval: {e}", exc_info=True)
+            return self._json_response(
+                {'error': "Error retrieving news articles."},
+                status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    def _get_paginator(self, filters):
+        """Return the paginator for the requested pagination mode"""
+        if filters.get('pagination') == 'cursor':
+            return KeysetPagination(sort_by=filters.get('sort_by', 'recent'))
+        return NewsPageNumberPagination()
+
+    def _json_response(self, data, status_code):
+        content = self.renderer_class().render(data)
+        return self._finalize(HttpResponse(content, content_type=self.renderer_class.media_type, status=status_code))
+
+    def _finalize(self, response):
+        response['Allow'] = ', '.join(m.upper() for m in self.http_method_names)
+        patch_vary_headers(response, ('Accept',))
+        return response
+
+
+
+class NewsExportView(APIPolicyMixin, NewsQueryMixin, View):
+    """
+    Bulk export of the news corpus as newline-delimited JSON (application/x-ndjson).
+
+    Accepts the NewsFilterSerializer filters (sort_by, pagination and cursor are ignored) and
+    streams every matching article, one list representation per line, ordered by
+    (published_date, id). `fields` narrows each line; id and published_date are always
+    included, as they make up the resume position. Rows are read through a server-side cursor in chunks of
+    NEWS_EXPORT_CHUNK_SIZE and streamed by an async generator, so memory stays flat under
+    ASGI whatever the number of exported rows.
+    An interrupted export resumes with `after_date` and `after_id` set to the
+    `published_date` and `id` of the last received line.
+
+    A plain Django view: DRF content negotiation would reject `Accept: application/x-ndjson`.
+    The DRF authentication, permission and throttle classes still apply (APIPolicyMixin).
+
+    Example: /api/news/export/?category=technology&after_date=2025-01-01T10:00:00Z&after_id=1234
+    """
+    http_method_names = ['get', 'head', 'options']
+    media_type = 'application/x-ndjson'
+
+    # Exports follow publication order with the id as tie-breaker
+    export_order = KeysetPagination(sort_by='oldest')
+
+    # Columns of the resume position, kept in sparse exports
+    resume_fields = ('id', 'published_date')
+
+    async def get(self, request, *args, **kwargs):
+        _, denied = await self._acheck_api_policy(request)
+        if denied is not None:
+            return denied
+
+        filter_serializer = NewsExportFilterSerializer(data=request.GET)
+        if not filter_serializer.is_valid():
+            return HttpResponse(
+                NewsJSONRenderer().render({'errors': filter_serializer.errors}),
+                content_type=NewsJSONRenderer.media_type,
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        filters = filter_serializer.validated_data
+
+        analysis = None
         if filters.get('search'):
-            search_term = filters['search']
+            analysis = await aanalyze_search(filters['search'])
+        queryset = self._apply_filters(Article.objects.all(), filters, analysis=analysis)
+        if filters.get('after_date') is not None:
             queryset = queryset.filter(
-                Q(title__icontains=search_term) | Q(content__icontains=search_term)
+                self.export_order.seek_filter(filters['after_date'], filters['after_id'], descending=False)
             )
-            # Derive keyword phrases (n-grams) from the search string and prefer longer phrases
-            kw_candidates = self._derive_keyword_phrases(search_term, max_ngram=4, max_phrases=30)
-            if kw_candidates:
-                q_obj = None
-                for kw in kw_candidates:
-                    # Search JSONField for the keyword text (case-insensitive)
-                    cond = Q(keywords__icontains=kw)
-                    q_obj = cond if q_obj is None else (q_obj | cond)
-                if q_obj is not None:
-                    queryset = queryset.filter(q_obj)
-        
-        # Category filter
-        if filters.get('category'):
-            queryset = queryset.filter(category__iexact=filters['category'])
-        
-        # Source filter
-        if filters.get('source'):
-            queryset = queryset.filter(source__iexact=filters['source'])
-        
-        # Author filter
-        if filters.get('author'):
-            queryset = queryset.filter(author__icontains=filters['author'])
-        
-        # Date range filters
-        if filters.get('date_from'):
-            queryset = queryset.filter(published_date__gte=filters['date_from'])
-        
-        if filters.get('date_to'):
-            queryset = queryset.filter(published_date__lte=filters['date_to'])
-        
-        
-        return queryset
+        queryset = queryset.order_by(*self.export_order.ordering(descending=False))
 
-    def _derive_keyword_phrases(self, text: str, max_ngram: int = 3, max_phrases: int = 50):
-        """Derive candidate keyword phrases from `text`.
+        fields = None
+        if filters.get('fields'):
+            requested = {*filters['fields'], *self.resume_fields}
+            fields = tuple(name for name in ArticleListSerializer.Meta.fields if name in requested)
 
-        - Tokenizes the text on whitespace/punctuation.
-        - Generates n-grams up to `max_ngram`.
-        - Returns phrases sorted by length (longer phrases first) and limited to `max_phrases`.
-        """
-        if not text:
-            return []
-
-        # Normalize whitespace and strip surrounding punctuation from tokens
-        tokens = [t.strip("'\"()[]{}:;,.!?-/") for t in re.split(r'[\s,]+', text) if t.strip()] 
-        if not tokens:
-            return []
-
-        n = min(max_ngram, len(tokens))
-        phrases = set()
-
-        # Generate n-grams (prefer longer n-grams)
-        for size in range(n, 0, -1):
-            for i in range(0, len(tokens) - size + 1):
-                gram = " ".join(tokens[i : i + size]).strip()
-                # skip very short tokens
-                if len(gram) < 2:
-                    continue
-                phrases.add(gram)
-
-        # Sort by number of words then by length, prefer longer/more specific phrases
-        sorted_phrases = sorted(phrases, key=lambda p: (-len(p.split()), -len(p)))
-        return sorted_phrases[:max_phrases]
-
-    def _apply_sorting(self, queryset, sort_by):
-        """Apply sorting to queryset"""
-        if sort_by == 'oldest':
-            return queryset.order_by('published_date')
-        elif sort_by == 'title':
-            return queryset.order_by('title')
-        else:  # 'recent' is default
-            return queryset.order_by('-published_date')
+        chunk_size = getattr(settings, 'NEWS_EXPORT_CHUNK_SIZE', 2000)
+        response = StreamingHttpResponse(
+            astream_fragment_lines(queryset, chunk_size=chunk_size, fields=fields),
+            content_type=self.media_type,
+        )
+        # Let proxies pass chunks through instead of buffering the whole export
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+
+class SourceLookupView(GenericAPIView):
+    """
+    Fuzzy source name lookup, e.g. for autocompleting the `source` filter.
+
+    On PostgreSQL names are matched by trigram word similarity (typos and partial names,
+    index-assisted by news_source_name_trgm); SQLite falls back to substring matching.
+
+    Example: /api/news/sources/?q=bbc%20nws&limit=5
+    """
+    queryset = Source.objects.all()
+    serializer_class = SourceLookupSerializer
+    pagination_class = None
+
+    def get(self, request, *args, **kwargs):
+        params_serializer = SourceLookupParamsSerializer(data=request.query_params)
+        if not params_serializer.is_valid():
+            return Response(
+                {'errors': params_serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        params = params_serializer.validated_data
+
+        sources = fuzzy_source_lookup(self.get_queryset(), params['q'], limit=params['limit'])
+        return Response({'results': self.get_serializer(sources, many=True).data})